@@ -0,0 +1,105 @@
+# Headless JSON stats API over the goal cube, for products embedding the numbers
+# Usage: uvicorn api:app --workers 4
+import numpy as np
+from starlette.applications import Starlette
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+import cube
+import dataset
+import memo
+import sections
+
+# Queries answered per player, with the query parameters they accept besides year, group and venue
+QUERIES = {
+    'goals': (cube.goals, ()),
+    'cards': (cube.club_goal_cards, ()),
+    'opponents-faced': (cube.opponents_faced, ()),
+    'favourite-opponents': (cube.favourite_opponent, ('top',)),
+    'single-match': (cube.goals_in_single_match, ('top',)),
+    'goal-types': (cube.type_of_goal, ()),
+    'positions': (cube.goal_by_position, ()),
+}
+
+
+# Bad query parameter, answered with 400
+class QueryError(ValueError):
+    pass
+
+
+# Year, competition group and venue filters of a request. Numbers are checked with isdecimal:
+# isdigit also accepts digits int() rejects, such as '²'
+def request_filters(data, params):
+    year = params.get('year', 'All Time')
+    if year != 'All Time':
+        if not year.isdecimal() or int(year) not in data.years:
+            raise QueryError(f'unknown year {year!r}')
+        year = int(year)
+    group = params.get('group')
+    if group is not None and group not in sections.COMPETITION_GROUPS:
+        raise QueryError(f'unknown competition group {group!r}')
+    venue = params.get('venue', 'All')
+    if venue not in sections.VENUES:
+        raise QueryError(f'unknown venue {venue!r}')
+    return year, sections.filters(group, venue=sections.VENUES[venue])
+
+
+# JSON value of a query result: numbers as ints, tables as lists of ranked rows
+def to_json(value):
+    if isinstance(value, dict):
+        return {name: to_json(item) for name, item in value.items()}
+    if isinstance(value, np.integer):
+        return int(value)
+    if hasattr(value, 'to_dict'):
+        return [dict(rank=int(rank), **{name: to_json(item) for name, item in row.items()})
+                for rank, row in value.to_dict('index').items()]
+    return value
+
+
+# Answer of a query for both players, cached per data version, year and parameters
+def answer(name, data, params):
+    query, extra = QUERIES[name]
+    year, query_filters = request_filters(data, params)
+    kwargs = {}
+    if 'top' in extra and 'top' in params:
+        if not params['top'].isdecimal() or int(params['top']) < 1:
+            raise QueryError(f"top must be a positive integer, not {params['top']!r}")
+        kwargs['top'] = int(params['top'])
+
+    def compute():
+        result = query(sections.selection(data, year, query_filters), **kwargs)
+        return dict(zip(dataset.PLAYERS, (to_json(value) for value in result)))
+
+    key = ('api', name, sections.frozen(query_filters), tuple(sorted(kwargs.items())))
+    return memo.cached((data.version, year), key, compute)
+
+
+# Endpoints are plain functions, run in the threadpool: loading a new data version hashes and
+# parses the CSV, which would otherwise block the event loop for every request
+def query_endpoint(request):
+    if request.path_params['name'] not in QUERIES:
+        raise HTTPException(404)
+    data = dataset.load()
+    try:
+        body = answer(request.path_params['name'], data, request.query_params)
+    except QueryError as error:
+        return JSONResponse({'error': str(error)}, status_code=400)
+    return JSONResponse({'version': data.version, 'year': request.query_params.get('year', 'All Time'), **body})
+
+
+# Values accepted by the query parameters
+def options_endpoint(request):
+    data = dataset.load()
+    return JSONResponse({'queries': list(QUERIES), 'years': ['All Time', *data.years],
+                         'groups': list(sections.COMPETITION_GROUPS), 'venues': list(sections.VENUES)})
+
+
+async def not_found(request, exc):
+    return JSONResponse({'error': f'unknown query {request.url.path!r}'}, status_code=404)
+
+
+app = Starlette(routes=[
+    Route('/', options_endpoint),
+    Route('/{name}', query_endpoint),
+], exception_handlers={404: not_found})
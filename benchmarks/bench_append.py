@@ -0,0 +1,88 @@
+# Benchmark of appending new goals: dataset.append, which parses and aggregates only the new
+# rows, against reloading the whole file, checking both give the same frame, cube and pages
+# and that a batch with a malformed row leaves the file untouched
+# Usage: python benchmarks/bench_append.py [scale] [new rows] [batches]
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import dataset
+import sections
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'data.csv')
+
+
+# Every panel value of every page and year, without the selections
+def page_values(data):
+    values = {}
+    for page, panels in sections.PAGES.items():
+        for year in ['All Time', *data.years]:
+            for panel in panels:
+                sel = sections.selection(data, year, panel['filters'])
+                values[page, year, panel['title']] = {name: value for name, value in
+                                                      sections._compute(panel, data, year, sel).items()
+                                                      if name != 'selection'}
+    return values
+
+
+# A batch with a malformed row raises and leaves the file and the loaded dataset as they were
+def check_malformed_row(raw_df, path):
+    before = dataset.load(path)
+    with open(path, 'rb') as f:
+        content = f.read()
+    row = raw_df.iloc[[-1]].assign(Date='2023-03-20')
+    try:
+        dataset.append(row, path)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('a row with a malformed date was appended')
+    with open(path, 'rb') as f:
+        assert f.read() == content
+    dataset.clear_cache()
+    assert dataset.load(path).version == before.version
+
+
+def main(scale=1, new_rows=100, batches=4):
+    dataset.BINARY_CACHE = False
+    raw_df = pd.concat([pd.read_csv(DATA_PATH, dtype=str)] * scale, ignore_index=True)
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'data.csv')
+        raw_df.iloc[:-new_rows].to_csv(path, index=False)
+        check_malformed_row(raw_df, path)
+
+        start = timeit.default_timer()
+        bounds = np.linspace(len(raw_df) - new_rows, len(raw_df), batches + 1).astype(int)
+        for first, last in zip(bounds[:-1], bounds[1:]):
+            appended = dataset.append(raw_df.iloc[first:last], path)
+        append = (timeit.default_timer() - start) / batches
+
+        dataset.clear_cache()
+        start = timeit.default_timer()
+        rebuilt = dataset.load(path)
+        reload = timeit.default_timer() - start
+    finally:
+        shutil.rmtree(directory)
+
+    assert appended.version == rebuilt.version
+    pd.testing.assert_frame_equal(appended.df, rebuilt.df)
+    pd.testing.assert_series_equal(appended.memory['after'], rebuilt.memory['after'])
+    for name in ['cells', 'matches', 'minutes']:
+        pd.testing.assert_frame_equal(getattr(appended.cube, name), getattr(rebuilt.cube, name))
+    assert repr(page_values(appended)) == repr(page_values(rebuilt))
+
+    print(f'{len(raw_df)} rows ({scale}x), {new_rows} new rows in {batches} batches: '
+          f'same frame, cube and page values as a full reload; a malformed row is rejected')
+    print(f'append per batch: {append * 1000:8.1f} ms')
+    print(f'     full reload: {reload * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:4]))
@@ -0,0 +1,69 @@
+# Benchmark of the page base slices: chained string comparisons, categorical isin
+# masks and competition group / year bitmap intersections
+# Usage: python benchmarks/bench_bitmap.py [scale]
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import preprocessor
+import sections
+from bitmap import BitmapIndex
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'data.csv')
+
+GROUPS = ['League', "Europe's Top 5", 'Domestic Cup', 'Domestic Super Cup', 'Other Cups']
+YEARS = ['All Time', 2012]
+
+
+# Former page slices: one string comparison per competition, OR-ed
+def chained(raw_df, competitions, year):
+    mask = raw_df['Competition'] == competitions[0]
+    for competition in competitions[1:]:
+        mask = mask | (raw_df['Competition'] == competition)
+    if year != 'All Time':
+        mask = mask & (raw_df['Year'] == year)
+    return mask.to_numpy()
+
+
+def isin(df, competitions, year):
+    mask = df['Competition'].isin(competitions).to_numpy()
+    if year != 'All Time':
+        mask = mask & (df['Year'] == year).to_numpy()
+    return mask
+
+
+def bitmaps(index, competitions, year):
+    bitmap = index.isin('Competition', competitions)
+    if year != 'All Time':
+        bitmap = bitmap & index.equals('Year', year)
+    return bitmap.to_mask()
+
+
+def main(scale=100, repeat=5):
+    raw_df = pd.concat([pd.read_csv(DATA_PATH, dtype=str)] * scale, ignore_index=True)
+    raw_df['Year'] = pd.to_datetime(raw_df['Date'], format='%m/%d/%Y').dt.year
+    raw_df = preprocessor.normalize(raw_df)
+    df = preprocessor.compact(raw_df)
+    start = timeit.default_timer()
+    index = BitmapIndex(df, ['Year', 'Competition'])
+    print(f'{len(df)} rows ({scale}x), index built in {(timeit.default_timer() - start) * 1000:.1f} ms\n')
+
+    for group in GROUPS:
+        competitions = sections.COMPETITION_GROUPS[group]
+        for year in YEARS:
+            expected = chained(raw_df, competitions, year)
+            assert np.array_equal(isin(df, competitions, year), expected)
+            assert np.array_equal(bitmaps(index, competitions, year), expected)
+            times = [min(timeit.repeat(lambda: func(frame, competitions, year), number=10, repeat=repeat)) / 10
+                     for func, frame in [(chained, raw_df), (isin, df), (bitmaps, index)]]
+            name = f'{group} / {year}'
+            print(f'{name:<30} chained ==: {times[0] * 1000:7.2f} ms  isin: {times[1] * 1000:6.2f} ms  '
+                  f'bitmap: {times[2] * 1000:6.2f} ms')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,63 @@
+# Benchmark of the Club Goals cards: the former four helper calls per section, each slicing the
+# goals of a player, against cube.club_goal_cards, one compare.summary pass over the selection
+# Usage: python benchmarks/bench_cards.py [scale]
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import cube
+import dataset
+import sections
+from common import scaled
+
+# Boolean masks over rows per section: before, six per player over the goals (a Player mask per
+# stat and the Venue masks); after, the five of compare.summary over the selected cube cells
+SCANS_BEFORE = 6 * len(dataset.PLAYERS)
+SCANS_AFTER = 5
+
+
+# Goals of a year and competitions, as the pages sliced them before the cube
+def goals_slice(df, year, competitions):
+    goals = df if year == 'All Time' else df[df['Year'] == year]
+    return goals if competitions is None else goals[goals['Competition'].isin(competitions)]
+
+
+# Former cards: a sub-frame per stat and player, then len() on it
+def separate_calls(goals, players=dataset.PLAYERS):
+    cards = []
+    for player in players:
+        cards.append({'total': len(goals[goals['Player'] == player]),
+                      'home': len(goals[(goals['Player'] == player) & (goals['Venue'] == 'H')]),
+                      'away': len(goals[(goals['Player'] == player) & (goals['Venue'] == 'A')]),
+                      'opponents': goals[goals['Player'] == player]['Opponent'].nunique()})
+    return tuple(cards)
+
+
+def main(scale=1, repeat=5):
+    data = dataset.load(scaled(scale))
+    groups = list(dict.fromkeys(panel['filters']['competitions'] and tuple(panel['filters']['competitions'])
+                                for panels in sections.PAGES.values() for panel in panels
+                                if panel['kind'] == 'club_goals'))
+    years = ['All Time', *data.years]
+    cases = [(year, None if group is None else list(group)) for year in years for group in groups]
+    # The selection is shared with the panel's chart, so only the cards are timed after
+    selections = [data.cube.select(year, competitions=competitions) for year, competitions in cases]
+    for (year, competitions), selection in zip(cases, selections):
+        assert separate_calls(goals_slice(data.df, year, competitions)) == cube.club_goal_cards(selection)
+
+    def before():
+        return [separate_calls(goals_slice(data.df, year, competitions)) for year, competitions in cases]
+
+    def after():
+        return [cube.club_goal_cards(selection) for selection in selections]
+
+    print(f'{len(data.df)} rows ({scale}x), {len(groups)} card sections x {len(years)} years')
+    print(f'masks over the rows per section: {SCANS_BEFORE} -> {SCANS_AFTER}')
+    for name, func in [('separate', before), ('single pass', after)]:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f'{name:>12}: {best * 1000:8.2f} ms  ({best * 1000 / len(cases):.2f} ms per section)')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1)
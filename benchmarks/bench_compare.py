@@ -0,0 +1,93 @@
+# Benchmark of the N-player comparison engine against one filter pass per player, the way
+# the former two-player helper functions compared players, on a synthetic goals dataset
+# Usage: python benchmarks/bench_compare.py [players] [rows]
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import compare
+import cube
+
+COMPETITIONS = ['LaLiga', 'Premier League', 'Serie A', 'Ligue 1', 'UEFA Champions League', 'Copa del Rey']
+MATCHDAYS = [str(day) for day in range(1, 39)] + ['Group Stage', 'Round of 16', 'Quarter-Finals', 'Semi-Finals',
+                                                   'Final']
+TYPES = ['Right-footed shot', 'Left-footed shot', 'Header', 'Penalty', 'Direct free kick', 'Tap-in']
+POSITIONS = ['CF', 'LW', 'RW', 'AM', 'SS']
+
+
+# Goals of the players in the columns of the preprocessed dataset, with categoricals
+def synthetic(n_players, n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    players = [f'Player {number:03d}' for number in range(n_players)]
+    clubs = [f'Club {number:03d}' for number in range(100)]
+    dates = pd.date_range('2002-07-01', '2023-06-30', freq='D')
+    date = dates[rng.integers(len(dates), size=n_rows)]
+
+    def pick(values):
+        return pd.Categorical.from_codes(rng.integers(len(values), size=n_rows), values)
+
+    return pd.DataFrame({
+        'Player': pick(players), 'Competition': pick(COMPETITIONS), 'Matchday': pick(MATCHDAYS),
+        'Date': date, 'Year': date.year.astype('int16'), 'Venue': pick(['A', 'H']), 'Club': pick(clubs),
+        'Opponent': pick(clubs), 'Type': pick(TYPES), 'Playing_Position': pick(POSITIONS),
+        'Minute': rng.integers(1, 91, size=n_rows),
+    })
+
+
+# Goals per value (or combination of values), most first
+def count_values(values):
+    keys = list(values.columns) if isinstance(values, pd.DataFrame) else values
+    counts = values.groupby(keys, observed=True, sort=False).size()
+    return counts.sort_values(ascending=False, kind='stable').rename('count')
+
+
+# One player's stats from its own slice of the goals, as the helpers did for each of the two players
+def per_player(df, player, top=10):
+    goals = df[df['Player'] == player]
+    venues = goals['Venue'].value_counts()
+    matchdays = goals['Matchday'].value_counts()
+    return {
+        'summary': [len(goals), venues.get('H', 0), venues.get('A', 0), goals['Opponent'].nunique(),
+                    *(matchdays.get(matchday, 0) for matchday in compare.KNOCKOUT_COLUMNS)],
+        'years': goals.groupby('Year').size(),
+        'types': count_values(goals['Type']),
+        'positions': count_values(goals['Playing_Position']),
+        'opponents': count_values(goals['Opponent']).head(top),
+        'matches': count_values(goals[['Date', 'Opponent']]).head(top),
+    }
+
+
+def main(n_players=500, n_rows=500_000, repeat=3):
+    df = synthetic(n_players, n_rows)
+    players = list(df['Player'].cat.categories)
+    start = timeit.default_timer()
+    selection = cube.Cube(df, players).select()
+    build = timeit.default_timer() - start
+    print(f'{n_rows} rows, {n_players} players, cube built in {build:.2f} s ({len(selection.cells)} cells)')
+
+    result = compare.compare(selection)
+    for player in players[:20]:
+        expected = per_player(df, player)
+        assert result['players'].loc[player, 'Totals'].tolist() == expected['summary']
+        years = result['players'].loc[player, 'Year']
+        assert years[years > 0].to_dict() == expected['years'].to_dict()
+        opponents = result['opponents'][result['opponents']['Player'] == player]
+        assert opponents['Opponent'].tolist() == expected['opponents'].index.tolist()
+        assert opponents['Goals'].tolist() == expected['opponents'].tolist()
+        matches = result['matches'][result['matches']['Player'] == player]
+        assert matches['Goals'].tolist() == expected['matches'].tolist()
+
+    loop = min(timeit.repeat(lambda: [per_player(df, player) for player in players], number=1, repeat=repeat))
+    engine = min(timeit.repeat(lambda: compare.compare(selection), number=1, repeat=repeat))
+    print(f'one pass per player: {loop * 1000:9.1f} ms')
+    print(f'     grouped engine: {engine * 1000:9.1f} ms ({loop / engine:.0f}x, {(build + engine) * 1000:.1f} ms '
+          f'with the cube build)')
+    print(f"wide result: {result['players'].shape[0]} players x {result['players'].shape[1]} columns")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
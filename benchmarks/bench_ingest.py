@@ -0,0 +1,79 @@
+# Benchmark of streaming ingestion against parsing the whole CSV before building the cube:
+# rows/s and peak memory, each measured in a new interpreter, on synthetic goal logs of many
+# players. Repeating the shipped rows would not do: repeated goals collapse into the cube of
+# the original file, while distinct goals give the cube about one row each
+# Usage: python benchmarks/bench_ingest.py [rows ...]
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import cube
+import dataset
+import ingest
+from bench_compare import synthetic
+from common import DATA_PATH, status_mb
+
+
+# CSV file of a synthetic goal log in the columns and formats of data.csv, written once per size
+def synthetic_csv(n_rows, n_players=500):
+    path = os.path.join(tempfile.gettempdir(), f'goat_synthetic_{n_players}_{n_rows}.csv')
+    if not os.path.exists(path):
+        df = synthetic(n_players, n_rows)
+        raw_df = df.assign(Date=df['Date'].dt.strftime('%m/%d/%Y'), Minute=df['Minute'].astype(str),
+                           Season=df['Year'].astype(str), Result='1:00', At_score='1:00', Goal_assist='')
+        # Written under a temporary name, so an interrupted run leaves no partial file
+        partial = f'{path}.{os.getpid()}.tmp'
+        raw_df[pd.read_csv(DATA_PATH, nrows=0).columns].to_csv(partial, index=False)
+        os.replace(partial, path)
+    return path
+
+
+# Run in the child interpreter: build the cube of every player, streaming or from the whole frame
+def child(path, mode):
+    before = status_mb('VmRSS')[0]
+    start = time.perf_counter()
+    if mode == 'stream':
+        goal_cube, result = ingest.stream(path)
+    else:
+        df = dataset.preprocess(pd.read_csv(path, dtype=str))
+        goal_cube = cube.Cube(df, list(df['Player'].cat.categories))
+    seconds = time.perf_counter() - start
+    peak = status_mb('VmHWM')[0]
+    print(f'{seconds} {peak - before}')
+
+
+def run(path, mode):
+    output = subprocess.run([sys.executable, __file__, '--child', path, mode],
+                            capture_output=True, text=True, check=True).stdout
+    return [float(value) for value in output.split()]
+
+
+def main(sizes=(200_000, 1_000_000)):
+    # Same cube either way, here with chunks much smaller than the file
+    path = synthetic_csv(20_000)
+    streamed, _ = ingest.stream(path, chunk_rows=1000)
+    df = dataset.preprocess(pd.read_csv(path, dtype=str))
+    full = cube.Cube(df, list(df['Player'].cat.categories))
+    for name in ['cells', 'matches', 'minutes']:
+        pd.testing.assert_frame_equal(getattr(streamed, name), getattr(full, name))
+
+    for rows in sizes:
+        path = synthetic_csv(rows)
+        _, result = ingest.stream(path)
+        print(f"{rows} rows, csv {os.path.getsize(path) / 2 ** 20:.0f} MB, chunks of {ingest.CHUNK_ROWS} rows, "
+              f"cube tables of {', '.join(str(cells) for cells in result['cells'])} rows")
+        for mode in ['whole file', 'stream']:
+            seconds, peak = run(path, mode)
+            print(f'{mode:>12}: {seconds:6.1f} s  {rows / seconds:9,.0f} rows/s  peak memory +{peak:.0f} MB')
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main([int(rows) for rows in sys.argv[1:]] or (200_000, 1_000_000))
@@ -0,0 +1,31 @@
+# Memory footprint of the compact columnar dataset and mask evaluation speed
+# Usage: python benchmarks/bench_memory.py [scale]
+import os
+import sys
+import timeit
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import preprocessor
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'data.csv')
+
+
+def main(scale=100, repeat=5):
+    raw_df = pd.read_csv(DATA_PATH, dtype=str)
+    raw_df = pd.concat([raw_df] * scale, ignore_index=True)
+    df = preprocessor.compact(preprocessor.normalize(preprocessor.dataframe_modifier(raw_df)))
+    print(f'{len(df)} rows ({scale}x)\n')
+    print(preprocessor.memory_report(raw_df, df).to_string(), '\n')
+
+    masks = [('Player', 'Cristiano Ronaldo'), ('Venue', 'H'), ('Competition', 'LaLiga'), ('Opponent', 'Sevilla FC')]
+    for column, value in masks:
+        before = min(timeit.repeat(lambda: raw_df[column] == value, number=10, repeat=repeat)) / 10
+        after = min(timeit.repeat(lambda: df[column] == value, number=10, repeat=repeat)) / 10
+        mask = f'{column} == {value!r}'
+        print(f'{mask:<34} string: {before * 1000:6.2f} ms  categorical: {after * 1000:6.2f} ms')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,36 @@
+# Benchmark of dataframe_modifier against the former per-row implementation
+# Usage: python benchmarks/bench_preprocess.py [scale]
+import os
+import sys
+import timeit
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import preprocessor
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'data.csv')
+
+
+# Former implementation: Python loop over str.split and an outer join
+def legacy_dataframe_modifier(df):
+    years = []
+    for i in df['Date'].str.split('/'):
+        years.append(i[2])
+    years = pd.DataFrame(years)
+    years = years.rename(columns={0: 'Year'})
+    df = df.join(years, how='outer')
+    return df
+
+
+def main(scale=100, repeat=5):
+    df = pd.read_csv(DATA_PATH)
+    df = pd.concat([df] * scale, ignore_index=True)
+    print(f'{len(df)} rows ({scale}x)')
+    for name, func in [('legacy', legacy_dataframe_modifier), ('vectorized', preprocessor.dataframe_modifier)]:
+        best = min(timeit.repeat(lambda: func(df), number=1, repeat=repeat))
+        print(f'{name:>10}: {best * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
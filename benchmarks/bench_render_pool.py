@@ -0,0 +1,41 @@
+# Benchmark of a page's chart rendering: one by one in process against the worker pool
+# Usage: python benchmarks/bench_render_pool.py [workers] [page] [year]
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import charts
+import cube
+import dataset
+import sections
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'data.csv')
+
+
+def main(workers=4, page='Overall', year='All Time'):
+    data = dataset.load(DATA_PATH)
+    jobs = []
+    for panel in sections.PAGES[page]:
+        if 'chart' in panel:
+            selection = sections.compute(panel, data, year)['selection']
+            jobs.append((panel['chart'], cube.chart_data(selection, panel['chart']['column'])))
+    print(f'{page} / {year}: {len(jobs)} charts, {os.cpu_count()} CPUs')
+
+    start = time.perf_counter()
+    sequential = [charts.render(spec, chart_data) for spec, chart_data in jobs]
+    print(f'{"in process":>16}: {(time.perf_counter() - start) * 1000:8.0f} ms')
+
+    with ProcessPoolExecutor(workers) as executor:
+        # Workers import matplotlib and seaborn once, before the page is timed
+        list(executor.map(charts.render, *zip(*jobs)))
+        start = time.perf_counter()
+        pooled = list(executor.map(charts.render, *zip(*jobs)))
+        print(f'{f"{workers} workers":>16}: {(time.perf_counter() - start) * 1000:8.0f} ms')
+    assert [len(image) for image in pooled] == [len(image) for image in sequential]
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 4, *args[1:2], *[int(year) for year in args[2:3]])
@@ -0,0 +1,83 @@
+# Benchmark of the SQLite backend against the pandas cube: build time, then a selection and
+# every page query on it, for representative page filters
+# Usage: python benchmarks/bench_sql.py [scale ...]
+import os
+import sys
+import tempfile
+import timeit
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import cube
+import dataset
+import sections
+import sqlstore
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'data.csv')
+
+# Year and filters of representative page selections
+SELECTIONS = {
+    'Overall / All Time': ('All Time', sections.filters()),
+    'LaLiga / 2012': (2012, sections.filters('LaLiga')),
+    'El Clásico / All Time': ('All Time', sections.filters(el_clasico=True)),
+    'Knockout / All Time': ('All Time', sections.filters(matchdays=sections.KNOCKOUT_MATCHDAYS)),
+    'League home / 2015': (2015, sections.filters('League', venue='H')),
+}
+
+
+# Every query of the pages on a selection
+def page_queries(goal_cube, year, filters):
+    selection = goal_cube.select(year, **filters)
+    return [cube.goals(selection), cube.club_goal_cards(selection), cube.opponents_faced(selection),
+            cube.quarter_semi_final(selection, 'Final'), cube.type_of_goal(selection),
+            cube.goal_by_position(selection), cube.favourite_opponent(selection),
+            cube.goals_in_single_match(selection), cube.chart_data(selection, 'Competition'),
+            cube.chart_data(selection, 'Minute')]
+
+
+# Both backends count goals with missing filter values, e.g. a blank matchday or opponent
+def check_missing_values(raw_df, directory):
+    raw_df = raw_df.copy()
+    raw_df.loc[0, 'Matchday'] = None
+    raw_df.loc[1, 'Opponent'] = None
+    raw_df.loc[2, 'Venue'] = None
+    df = dataset.preprocess(raw_df)
+    pandas_cube = cube.Cube(df, dataset.PLAYERS)
+    sql_cube = sqlstore.SqlCube(os.path.join(directory, 'missing.csv'), 'bench', df, dataset.PLAYERS)
+    assert sum(cube.goals(pandas_cube.select())) == len(df)
+    for year, filters in SELECTIONS.values():
+        assert repr(page_queries(pandas_cube, year, filters)) == repr(page_queries(sql_cube, year, filters))
+    os.remove(sql_cube.database)
+    print('goals with missing values: counted by both backends')
+
+
+def main(scales=(1, 100, 1000)):
+    raw_df = pd.read_csv(DATA_PATH, dtype=str)
+    directory = tempfile.mkdtemp()
+    check_missing_values(raw_df, directory)
+    for scale in scales:
+        df = dataset.preprocess(pd.concat([raw_df] * scale, ignore_index=True))
+        start = timeit.default_timer()
+        pandas_cube = cube.Cube(df, dataset.PLAYERS)
+        pandas_build = timeit.default_timer() - start
+        start = timeit.default_timer()
+        sql_cube = sqlstore.SqlCube(os.path.join(directory, f'data_{scale}x.csv'), 'bench', df, dataset.PLAYERS)
+        sql_build = timeit.default_timer() - start
+        print(f'{scale}x: {len(df)} rows, build: pandas cube {pandas_build:.2f} s, sqlite {sql_build:.2f} s '
+              f'({os.path.getsize(sql_cube.database) / 2 ** 20:.1f} MB)')
+
+        repeat = 5 if scale < 1000 else 1
+        for name, (year, filters) in SELECTIONS.items():
+            assert repr(page_queries(pandas_cube, year, filters)) == repr(page_queries(sql_cube, year, filters))
+            times = [min(timeit.repeat(func, number=1, repeat=repeat)) * 1000 for goal_cube in (pandas_cube, sql_cube)
+                     for func in (lambda: goal_cube.select(year, **filters),
+                                  lambda: page_queries(goal_cube, year, filters))]
+            print(f'{name:>24}: select pandas {times[0]:8.1f} ms  sqlite {times[2]:8.1f} ms   '
+                  f'with the page queries pandas {times[1]:8.1f} ms  sqlite {times[3]:8.1f} ms')
+        os.remove(sql_cube.database)
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main([int(scale) for scale in sys.argv[1:]] or (1, 100, 1000))
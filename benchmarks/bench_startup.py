@@ -0,0 +1,59 @@
+# Startup benchmark of a fresh worker process: parsing the CSV against memory-mapping the
+# preprocessed Arrow file, each measured in a new interpreter
+# Usage: python benchmarks/bench_startup.py [scale ...]
+import hashlib
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import dataset
+from common import scaled, status_mb
+
+
+# Run in the child interpreter: time the frame load and the Dataset build
+def child(path, binary):
+    # Anonymous (private) and file-backed (shareable) resident pages
+    before = status_mb('RssAnon', 'RssFile')
+    with open(path, 'rb') as f:
+        raw = f.read()
+    version = hashlib.sha1(raw).hexdigest()[:12]
+    start = time.perf_counter()
+    df, memory = dataset.read_binary(path, version) if binary else dataset.parse(raw)
+    frame = time.perf_counter() - start
+    dataset.Dataset(path, None, version, df, memory)
+    total = time.perf_counter() - start
+    after = status_mb('RssAnon', 'RssFile')
+    print(f'{frame * 1000:.1f} {total * 1000:.1f} {after[0] - before[0]:.1f} {after[1] - before[1]:.1f}')
+
+
+def run(path, binary):
+    output = subprocess.run([sys.executable, __file__, '--child', path, str(int(binary))],
+                            capture_output=True, text=True, check=True).stdout
+    return [float(value) for value in output.split()]
+
+
+def main(scales=(1, 100)):
+    for scale in scales:
+        path = scaled(scale)
+        with open(path, 'rb') as f:
+            raw = f.read()
+        version = hashlib.sha1(raw).hexdigest()[:12]
+        if dataset.read_binary(path, version) is None:
+            dataset.write_binary(path, version, *dataset.parse(raw))
+
+        print(f'{scale}x: csv {os.path.getsize(path) / 2 ** 20:.1f} MB, '
+              f'arrow {os.path.getsize(dataset.binary_path(path, version)) / 2 ** 20:.1f} MB')
+        for name, binary in [('csv', False), ('arrow mmap', True)]:
+            # Best of three fresh processes
+            frame, total, anon, shared = min(run(path, binary) for _ in range(3))
+            print(f'{name:>12}: frame {frame:8.1f} ms  dataset {total:8.1f} ms  '
+                  f'private +{anon:.1f} MB  file-backed +{shared:.1f} MB')
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], sys.argv[3] == '1')
+    else:
+        main([int(scale) for scale in sys.argv[1:]] or (1, 100))
@@ -0,0 +1,47 @@
+# Helpers shared by the benchmark scripts: the shipped dataset, scaled copies of it and the
+# memory of the running process
+import hashlib
+import os
+import resource
+import tempfile
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'data.csv')
+
+
+# The dataset repeated scale times, written by repeating the rows of the file. Copies are named
+# after the content of the file, so a changed dataset never reuses a stale copy
+def scaled(scale, path=DATA_PATH):
+    if scale == 1:
+        return path
+    with open(path, 'rb') as f:
+        content = f.read()
+    version = hashlib.sha1(content).hexdigest()[:12]
+    target = os.path.join(tempfile.gettempdir(), f'goat_data_{version}_{scale}x.csv')
+    if not os.path.exists(target):
+        header, rows = content.split(b'\n', 1)
+        if not rows.endswith(b'\n'):
+            rows += b'\n'
+        # Written under a temporary name, so an interrupted run leaves no partial copy
+        partial = f'{target}.{os.getpid()}.tmp'
+        with open(partial, 'wb') as f:
+            f.write(header + b'\n')
+            for _ in range(scale):
+                f.write(rows)
+        os.replace(partial, target)
+    return target
+
+
+# Fields of /proc/self/status in MB, e.g. VmRSS (resident), VmHWM (peak resident), RssAnon
+# (private) and RssFile (file-backed pages)
+def status_mb(*names):
+    with open('/proc/self/status') as f:
+        fields = dict(line.split(':', 1) for line in f)
+    return tuple(int(fields[name].split()[0]) / 1024 for name in names)
+
+
+# Resident set size of the process in MB, or its peak where /proc is not available
+def rss_mb():
+    try:
+        return status_mb('VmRSS')[0]
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
@@ -0,0 +1,92 @@
+# Load test of the stats API: serves api.app with uvicorn on a local port and keeps
+# concurrent keep-alive clients busy, reporting sustained throughput and latency
+# Usage: python benchmarks/load_api.py [clients] [seconds]
+import http.client
+import itertools
+import json
+import os
+import socket
+import sys
+import threading
+import time
+import urllib.parse
+
+import numpy as np
+import uvicorn
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.chdir(os.path.join(os.path.dirname(__file__), '..'))
+import api
+
+
+# Mix of queries a consumer sends, over every year and competition group
+def request_paths(options):
+    groups = [None, *options['groups']]
+    for query, year, group in itertools.product(options['queries'], options['years'], groups):
+        params = {'year': year} if group is None else {'year': year, 'group': group}
+        yield f'/{query}?{urllib.parse.urlencode(params)}'
+
+
+# Send one request, recording its latency and any non-200 answer
+def get(connection, path, latencies, errors):
+    start = time.perf_counter()
+    connection.request('GET', path)
+    response = connection.getresponse()
+    response.read()
+    latencies.append(time.perf_counter() - start)
+    if response.status != 200:
+        errors.append((path, response.status))
+
+
+# Keep-alive client cycling through its paths until the deadline
+def client(port, paths, deadline, latencies, errors):
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    for path in itertools.cycle(paths):
+        if time.perf_counter() > deadline:
+            break
+        get(connection, path, latencies, errors)
+    connection.close()
+
+
+def main(clients=8, seconds=10):
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(api.app, port=port, log_level='warning'))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    connection.request('GET', '/')
+    paths = list(request_paths(json.loads(connection.getresponse().read())))
+    connection.close()
+
+    for phase, duration in [('cold', None), ('warm', seconds)]:
+        latencies, errors = [], []
+        start = time.perf_counter()
+        if duration is None:
+            # Every distinct query once, computing and caching the answers
+            connection = http.client.HTTPConnection('127.0.0.1', port)
+            for path in paths:
+                get(connection, path, latencies, errors)
+            connection.close()
+        else:
+            deadline = start + duration
+            workers = [threading.Thread(target=client, args=(port, paths[i::clients], deadline, latencies, errors))
+                       for i in range(clients)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        elapsed = time.perf_counter() - start
+        latencies = np.array(latencies) * 1000
+        print(f'{phase}: {len(latencies)} requests in {elapsed:.1f} s = {len(latencies) / elapsed:8.0f} req/s  '
+              f'p50 {np.percentile(latencies, 50):.2f} ms  p99 {np.percentile(latencies, 99):.2f} ms  '
+              f'errors {len(errors)}')
+        assert not errors, errors[:5]
+    server.should_exit = True
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
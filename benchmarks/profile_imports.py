@@ -0,0 +1,63 @@
+# Import-time profile of the app's entry modules, from `python -X importtime` in fresh interpreters
+# Usage: python benchmarks/profile_imports.py [module ...] [--top N]
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Modules a worker imports before serving: the stats API, the page registry, the chart renderer
+MODULES = ['api', 'sections', 'charts', 'dataset']
+
+# Heavy third-party packages reported separately
+PACKAGES = ['streamlit', 'matplotlib', 'seaborn', 'pandas', 'numpy', 'pyarrow', 'starlette', 'uvicorn', 'scipy']
+
+
+# Cumulative import time per module (us) and the wall-clock time of a fresh import (s)
+def profile(module):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)', line)
+        if match:
+            cumulative.setdefault(match.group(4), int(match.group(2)))
+    return cumulative, wall
+
+
+# Time spent importing each heavy package (its top-level import), in ms
+def package_times(cumulative):
+    totals = defaultdict(float)
+    for name, micros in cumulative.items():
+        if name in PACKAGES and micros:
+            totals[name] = micros / 1000
+    return totals
+
+
+def main(modules, top=8):
+    for module in modules:
+        # Best of three fresh interpreters
+        runs = [profile(module) for _ in range(3)]
+        cumulative, wall = min(runs, key=lambda run: run[1])
+        packages = package_times(cumulative)
+        print(f'import {module}: {wall * 1000:.0f} ms wall, {cumulative.get(module, 0) / 1000:.0f} ms importing')
+        print('  packages: ' + ', '.join(f'{name} {ms:.0f} ms' for name, ms in
+                                         sorted(packages.items(), key=lambda item: -item[1])))
+        own = sorted(((micros, name) for name, micros in cumulative.items()
+                      if os.path.exists(os.path.join(ROOT, f'{name}.py'))), reverse=True)
+        print('  project modules: ' + ', '.join(f'{name} {micros / 1000:.0f} ms' for micros, name in own[:top]))
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    top = 8
+    if '--top' in args:
+        index = args.index('--top')
+        top = int(args[index + 1])
+        del args[index:index + 2]
+    main(args or MODULES, top)
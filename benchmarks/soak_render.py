@@ -0,0 +1,71 @@
+# Soak test of chart rendering: renders the page charts many times and checks the RSS stays
+# flat after a warm-up (it grows with unclosed pyplot figures). Exits with 1 when it grew by
+# more than the allowed MB
+# Usage: python benchmarks/soak_render.py [iterations] [--pyplot] [--max-growth=MB]
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import charts
+import cube
+import dataset
+from common import DATA_PATH, rss_mb
+
+SPECS = [
+    charts.bar_chart('Competition', 'Goals per Competition', (7, 4)),
+    charts.bar_chart('Year', 'Goals per Year', (7, 4), numeric=True),
+    charts.minute_histogram(figsize=(10, 4)),
+]
+
+
+# Former rendering: a new pyplot figure per chart, never closed
+def pyplot_render(spec, data):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    fig, ax = plt.subplots(figsize=spec['figsize'])
+    if spec['kind'] == 'bar':
+        sns.barplot(data, x='Goals', y=spec['column'], hue='Player', orient='h', errorbar=None, ax=ax)
+    else:
+        sns.histplot(data, x=spec['column'], weights='Goals', hue='Player', ax=ax)
+    image = io.BytesIO()
+    fig.savefig(image, **charts.SAVEFIG_OPTIONS)
+    return image.getvalue()
+
+
+def main(iterations=1000, pyplot=False, every=100, warmup=200, max_growth=20.0):
+    data = dataset.load(DATA_PATH)
+    years = sorted(data.df['Year'].unique())
+    render = pyplot_render if pyplot else charts.render
+    print(f"{'pyplot' if pyplot else 'charts.render'}: {iterations} renders, {warmup} warm-up renders")
+    start = time.perf_counter()
+    baseline = peak = None
+    for i in range(1, iterations + 1):
+        year = int(years[i % len(years)])
+        spec = SPECS[i % len(SPECS)]
+        render(spec, cube.chart_data(data.cube.select(year), spec['column']))
+        # Figures, fonts and caches are allocated during the warm-up; the RSS after it is the baseline
+        if i == warmup:
+            baseline = peak = rss_mb()
+        if i % every == 0:
+            rss = rss_mb()
+            if baseline is not None:
+                peak = max(peak, rss)
+            print(f'{i:>6} renders  rss {rss:8.1f} MB  ({rss - (baseline or rss):+.1f})  '
+                  f'{time.perf_counter() - start:6.1f} s')
+
+    if baseline is None:
+        print(f'no renders after the {warmup} warm-up renders, nothing checked')
+        return 1
+    growth = peak - baseline
+    print(f'rss growth after warm-up: {growth:+.1f} MB (allowed {max_growth:.1f} MB): '
+          f"{'ok' if growth <= max_growth else 'FAILED'}")
+    return 0 if growth <= max_growth else 1
+
+
+if __name__ == '__main__':
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = dict(arg[2:].split('=', 1) for arg in sys.argv[1:] if arg.startswith('--') and '=' in arg)
+    sys.exit(main(int(args[0]) if args else 1000, pyplot='--pyplot' in sys.argv,
+                  max_growth=float(options.get('max-growth', 20.0))))
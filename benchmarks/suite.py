@@ -0,0 +1,241 @@
+# Benchmark suite: every helper.py function, the cube queries, the preprocessing steps and a
+# headless run of every app page for representative years, on the shipped CSV and on scaled
+# copies of it. Each run is saved as JSON in benchmarks/results, so runs can be compared
+# Usage: python benchmarks/suite.py run [name] [--scales 1,100] [--repeat 5] [--filter text]
+#        python benchmarks/suite.py compare base.json new.json [--threshold 0.1]
+import argparse
+import inspect
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+import charts
+import compare
+import cube
+import dataset
+import helper
+import memo
+import preprocessor
+import sections
+import warmup
+from common import scaled
+
+RESULTS_DIR = os.path.join('benchmarks', 'results')
+
+# Years of the page runs: the whole career, a peak year of both players and a late one
+YEARS = ['All Time', 2012, 2021]
+
+
+# Every public function of helper.py
+def helper_benchmarks(data):
+    benchmarks = {
+        'filter_year': lambda: helper.filter_year(data.df),
+    }
+    # A new helper function has to be added here
+    functions = {name for name, value in vars(helper).items()
+                 if inspect.isfunction(value) and value.__module__ == 'helper'}
+    assert functions == set(benchmarks), functions ^ set(benchmarks)
+    return {f'helper.{name}': func for name, func in benchmarks.items()}
+
+
+# Cube selections and the queries the pages and the API run on them
+def cube_benchmarks(data):
+    selection = data.cube.select()
+    benchmarks = {
+        'cube.select': lambda: data.cube.select(),
+        'cube.select/LaLiga 2012': lambda: data.cube.select(2012, sections.COMPETITION_GROUPS['LaLiga']),
+        'cube.select/El Clásico': lambda: data.cube.select(el_clasico=True),
+        'cube.chart_data': lambda: cube.chart_data(selection, 'Competition'),
+        'cube.chart_data/Minute': lambda: cube.chart_data(selection, 'Minute'),
+        'cube.quarter_semi_final': lambda: cube.quarter_semi_final(selection, 'Final'),
+        'compare.compare': lambda: compare.compare(selection),
+    }
+    for name in ['goals', 'club_goal_cards', 'opponents_faced', 'type_of_goal', 'goal_by_position',
+                 'favourite_opponent', 'goals_in_single_match']:
+        benchmarks[f'cube.{name}'] = lambda query=getattr(cube, name): query(selection)
+    return benchmarks
+
+
+# Each preprocessing step on the raw rows, and the whole parse of the file
+def preprocessor_benchmarks(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    raw_df = pd.read_csv(io.BytesIO(raw), dtype=str)
+    modified = preprocessor.dataframe_modifier(raw_df)
+    normalized = preprocessor.normalize(modified)
+    return {
+        'read_csv': lambda: pd.read_csv(io.BytesIO(raw), dtype=str),
+        'preprocessor.dataframe_modifier': lambda: preprocessor.dataframe_modifier(raw_df),
+        'preprocessor.normalize': lambda: preprocessor.normalize(modified),
+        'preprocessor.compact': lambda: preprocessor.compact(normalized),
+        'dataset.preprocess': lambda: dataset.preprocess(raw_df),
+        'dataset.parse': lambda: dataset.parse(raw),
+    }
+
+
+# Headless run of app.py on a page and year, every panel open when open_all. The first call
+# creates the widgets; each timed call is the full rerun of choosing the year
+def page_run(page, year, open_all):
+    from streamlit.testing.v1 import AppTest
+    import streamlit_option_menu
+    from streamlit import logger
+    # Cached functions called outside a script run warn about the missing script run context
+    logger.set_log_level('error')
+    app = None
+
+    def run():
+        nonlocal app
+        # The navigation menu is a custom component, which the test runner cannot click
+        streamlit_option_menu.option_menu = lambda *args, **kwargs: page
+        if app is None:
+            app = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=600)
+            app.run()
+        app.sidebar.selectbox[0].set_value(year)
+        for panel in sections.PAGES[page]:
+            app.session_state[panel['key']] = open_all or panel['expanded']
+        app.run()
+        assert not app.exception, [exception.value for exception in app.exception]
+    return run
+
+
+# Empty the page result and chart image caches
+def clear_caches():
+    memo.results.clear()
+    shutil.rmtree(charts.CACHE_DIR, ignore_errors=True)
+
+
+def page_benchmarks(data):
+    benchmarks = {}
+    for page in sections.PAGES:
+        for year in YEARS:
+            benchmarks[f'page/{page}/{year}'] = page_run(page, year, False)
+            benchmarks[f'page/{page}/{year}/every panel'] = page_run(page, year, True)
+    return benchmarks
+
+
+# Best and median seconds of a function over repeated calls
+def measure(func, repeat):
+    func()
+    times = timeit.repeat(func, number=1, repeat=repeat)
+    return {'min': min(times), 'median': statistics.median(times), 'runs': repeat}
+
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    import streamlit
+    return {'commit': commit, 'date': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(),
+            'pandas': pd.__version__, 'numpy': np.__version__, 'streamlit': streamlit.__version__,
+            'cpus': os.cpu_count(), 'machine': platform.machine()}
+
+
+def run(name=None, scales=(1, 100), repeat=5, selected=None):
+    # The suite runs on its own chart cache, without the app's background warm-up
+    warmup.WARM_ON_START = False
+    charts.CACHE_DIR = tempfile.mkdtemp(prefix='goat_suite_charts_')
+    results = {}
+    try:
+        for scale in scales:
+            path = scaled(scale)
+            dataset.DATA_PATH = path
+            data = dataset.load(path)
+            print(f'{scale}x: {len(data.df)} rows')
+            groups = [preprocessor_benchmarks(path), helper_benchmarks(data), cube_benchmarks(data),
+                      page_benchmarks(data)]
+            for benchmarks in groups:
+                for bench_name, func in benchmarks.items():
+                    key = f'{scale}x/{bench_name}'
+                    if selected and selected not in key:
+                        continue
+                    # Pages are timed warm (as after the start-up warm-up) and, once for all time with
+                    # every panel open, from empty caches
+                    if key.endswith('All Time/every panel'):
+                        func()
+                        clear_caches()
+                        start = time.perf_counter()
+                        func()
+                        results[f'{key}/cold'] = {'min': time.perf_counter() - start, 'median': None, 'runs': 1}
+                    results[key] = measure(func, repeat if not bench_name.startswith('page/') else min(repeat, 3))
+                    print(f"{key:<60} {results[key]['min'] * 1000:10.2f} ms")
+    finally:
+        shutil.rmtree(charts.CACHE_DIR, ignore_errors=True)
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    info = environment()
+    name = name or f"{time.strftime('%Y%m%d-%H%M%S')}-{info['commit'] or 'nogit'}"
+    path = os.path.join(RESULTS_DIR, f'{name}.json')
+    with open(path, 'w') as f:
+        json.dump({'environment': info, 'scales': list(scales), 'results': results}, f, indent=2)
+    print(f'{len(results)} benchmarks saved to {path}')
+    return path
+
+
+# Ratio of the best times of two runs per benchmark; exits with 1 when a benchmark got slower
+# by more than the threshold (and by more than a millisecond, below which timings are noise)
+def compare_runs(base_path, new_path, threshold=0.1):
+    with open(base_path) as f:
+        base = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+    print(f"base: {base['environment']['commit']} {base['environment']['date']}, "
+          f"new: {new['environment']['commit']} {new['environment']['date']}")
+    slower, faster = [], []
+    for key, result in new['results'].items():
+        if key not in base['results']:
+            continue
+        before, after = base['results'][key]['min'], result['min']
+        ratio = after / before if before else float('inf')
+        change = ''
+        if abs(after - before) > 0.001 and ratio > 1 + threshold:
+            change = 'slower'
+            slower.append(key)
+        elif abs(after - before) > 0.001 and ratio < 1 / (1 + threshold):
+            change = 'faster'
+            faster.append(key)
+        print(f'{key:<60} {before * 1000:10.2f} ms {after * 1000:10.2f} ms {ratio:6.2f}x {change}')
+    missing = sorted(set(base['results']) ^ set(new['results']))
+    if missing:
+        print(f"only in one run: {', '.join(missing)}")
+    print(f'{len(slower)} slower, {len(faster)} faster (threshold {threshold:.0%})')
+    return 1 if slower else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark suite of the helpers, preprocessing and pages')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='run the suite and save the results')
+    run_parser.add_argument('name', nargs='?', help='name of the results file (default: date and commit)')
+    run_parser.add_argument('--scales', default='1,100', help='data scales, comma separated')
+    run_parser.add_argument('--repeat', type=int, default=5, help='timed calls per benchmark')
+    run_parser.add_argument('--filter', help='only run benchmarks whose name contains this text')
+    compare_parser = commands.add_parser('compare', help='compare two saved runs')
+    compare_parser.add_argument('base')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='relative change reported')
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        run(args.name, [int(scale) for scale in args.scales.split(',')], args.repeat, args.filter)
+    else:
+        sys.exit(compare_runs(args.base, args.new, args.threshold))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+
+# Boolean mask over the rows of a table packed into 64-bit words, so AND / OR
+# touch 64 rows per operation
+class Bitmap:
+    def __init__(self, words, length):
+        self.words = words
+        self.length = length
+
+    @classmethod
+    def from_mask(cls, mask):
+        mask = np.asarray(mask, dtype=bool)
+        padded = np.zeros(-(-len(mask) // 64) * 64, dtype=bool)
+        padded[:len(mask)] = mask
+        return cls(np.packbits(padded, bitorder='little').view(np.uint64), len(mask))
+
+    @classmethod
+    def full(cls, length):
+        return cls.from_mask(np.ones(length, dtype=bool))
+
+    @classmethod
+    def empty(cls, length):
+        return cls.from_mask(np.zeros(length, dtype=bool))
+
+    def __and__(self, other):
+        return Bitmap(self.words & other.words, self.length)
+
+    def __or__(self, other):
+        return Bitmap(self.words | other.words, self.length)
+
+    def to_mask(self):
+        return np.unpackbits(self.words.view(np.uint8), count=self.length, bitorder='little').astype(bool)
+
+
+# Bitmap per value of the indexed columns of a table, built once; sets of values (e.g. a
+# competition group) are OR-ed once and kept. Coded columns, with too many values for a
+# bitmap each, are matched on their category codes when a set of values is first queried
+class BitmapIndex:
+    def __init__(self, table, columns, coded_columns=()):
+        self.length = len(table)
+        self._bitmaps = {}
+        self._groups = {}
+        self._codes = {column: table[column].cat for column in coded_columns}
+        for column in columns:
+            codes, uniques = pd.factorize(table[column])
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            values = {}
+            for code, value in enumerate(uniques):
+                mask = np.zeros(self.length, dtype=bool)
+                mask[order[bounds[code]:bounds[code + 1]]] = True
+                values[value] = Bitmap.from_mask(mask)
+            self._bitmaps[column] = values
+
+    # Rows whose column equals the value
+    def equals(self, column, value):
+        if column in self._codes:
+            return self.isin(column, [value])
+        bitmap = self._bitmaps[column].get(value)
+        return bitmap if bitmap is not None else Bitmap.empty(self.length)
+
+    # Rows whose column is one of the values
+    def isin(self, column, values):
+        key = (column, tuple(values))
+        if key not in self._groups:
+            if column in self._codes:
+                accessor = self._codes[column]
+                codes = accessor.categories.get_indexer(list(values))
+                bitmap = Bitmap.from_mask(np.isin(accessor.codes.to_numpy(), codes[codes >= 0]))
+            else:
+                bitmap = Bitmap.empty(self.length)
+                for value in values:
+                    bitmap = bitmap | self.equals(column, value)
+            self._groups[key] = bitmap
+        return self._groups[key]
@@ -0,0 +1,235 @@
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from importlib import metadata
+
+import numpy as np
+import pandas as pd
+
+import cube
+import dataset
+import memo
+
+# Same encoding as st.pyplot, so images look the same as the former pyplot figures
+SAVEFIG_OPTIONS = {'bbox_inches': 'tight', 'dpi': 200, 'format': 'png'}
+
+# Idle figures kept per figsize for reuse
+POOL_SIZE = 2
+
+# Worker processes rendering a page's charts concurrently; 1 renders them one by one in process
+RENDER_WORKERS = int(os.environ.get('GOAT_RENDER_WORKERS', min(4, os.cpu_count() or 1)))
+
+# Encoded images are kept on disk per data version, so restarted servers skip matplotlib too
+CACHE_DIR = os.environ.get('GOAT_CHART_CACHE_DIR', './.chart_cache')
+
+
+# Rendering changes invalidate the cached images as well as data changes: this file and the
+# plotting library versions, read from the package metadata so nothing is imported
+def renderer_version():
+    with open(__file__, 'rb') as f:
+        digest = hashlib.sha1(f.read())
+    for package in ('matplotlib', 'seaborn'):
+        try:
+            digest.update(f'{package} {metadata.version(package)}'.encode())
+        except metadata.PackageNotFoundError:
+            pass
+    return digest.hexdigest()[:8]
+
+
+RENDERER_VERSION = renderer_version()
+
+# Figures are created without pyplot, so no global figure manager keeps them alive
+_pool = defaultdict(list)
+_pool_lock = threading.Lock()
+_stats = {'memory': 0, 'disk': 0, 'rendered': 0}
+_plotting = None
+_plotting_lock = threading.Lock()
+_render_executor = None
+_executor_lock = threading.Lock()
+
+
+# Horizontal bar chart of goals per value of a column, for both players
+def bar_chart(column, title, figsize, xticks=None, numeric=False, format='png'):
+    return {'kind': 'bar', 'column': column, 'title': title, 'figsize': figsize,
+            'xticks': xticks, 'numeric': numeric, 'format': format}
+
+
+# Histogram of goals per minute, for both players
+def minute_histogram(figsize=(30, 10), format='png'):
+    return {'kind': 'hist', 'column': 'Minute', 'figsize': figsize, 'format': format}
+
+
+# matplotlib and seaborn, imported and styled on the first chart actually drawn, so pages,
+# workers and the API serving cached images never pay their import time
+def plotting():
+    global _plotting
+    with _plotting_lock:
+        if _plotting is None:
+            import matplotlib
+            import seaborn
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            matplotlib.style.use('ggplot')
+            _plotting = {'sns': seaborn, 'Figure': Figure, 'FigureCanvasAgg': FigureCanvasAgg}
+        return _plotting
+
+
+# Figure of the given size from the pool, cleared and returned to it after use
+@contextmanager
+def pooled_figure(figsize):
+    with _pool_lock:
+        fig = _pool[figsize].pop() if _pool[figsize] else None
+    if fig is None:
+        fig = plotting()['Figure'](figsize=figsize)
+        plotting()['FigureCanvasAgg'](fig)
+    try:
+        yield fig
+    finally:
+        fig.clear()
+        with _pool_lock:
+            if len(_pool[figsize]) < POOL_SIZE:
+                _pool[figsize].append(fig)
+
+
+# Draw a chart spec with its data (Player, column, Goals) and encode it as PNG (or SVG) bytes
+def render(spec, data):
+    sns = plotting()['sns']
+    column = spec['column']
+    with pooled_figure(tuple(spec['figsize'])) as fig:
+        ax = fig.add_subplot()
+        if spec['kind'] == 'bar':
+            if spec.get('numeric'):
+                data = data.assign(**{column: pd.to_numeric(data[column])}).sort_values(column)
+            if len(data):
+                sns.barplot(data, x='Goals', y=column, hue='Player', orient='h', errorbar=None, ax=ax)
+            ax.set_title(spec['title'])
+            ax.set_xlabel('No of Goals')
+            if spec.get('xticks'):
+                ax.set_xticks(np.arange(*spec['xticks']))
+        else:
+            if len(data):
+                sns.histplot(data, x=column, weights='Goals', hue='Player', ax=ax)
+            ax.set_ylabel('No of Goals')
+            ax.tick_params(axis='x', labelrotation=90)
+
+        image = io.BytesIO()
+        fig.savefig(image, **dict(SAVEFIG_OPTIONS, format=spec.get('format', 'png')))
+        return image.getvalue()
+
+
+# Hash of everything the image depends on: the spec, the selection filters, the data version
+# and the renderer
+def cache_key(spec, selection, version):
+    described = {'spec': spec, 'filters': selection.filters, 'players': list(selection.players), 'version': version,
+                 'renderer': RENDERER_VERSION}
+    return hashlib.sha1(json.dumps(described, sort_keys=True, default=str).encode()).hexdigest()
+
+
+# Image of a chart spec over a selection: from memory, else from disk, else rendered and stored in both
+def cached_render(spec, selection, version):
+    return render_async(spec, selection, version).result()
+
+
+# Future of a chart image: already done when cached, else rendered in the worker pool (or in
+# this process without workers) and stored in memory and on disk once done
+def render_async(spec, selection, version):
+    key = cache_key(spec, selection, version)
+    future = Future()
+    image = _cached(key, _path(spec, key, version))
+    if image is not None:
+        future.set_result(image)
+        return future
+
+    def store(done):
+        if done.exception() is None:
+            _store(key, _path(spec, key, version), done.result())
+
+    data = cube.chart_data(selection, spec['column'])
+    executor = _executor()
+    if executor is None:
+        future.set_result(render(spec, data))
+    else:
+        try:
+            future = executor.submit(render, spec, data)
+        except BrokenProcessPool:
+            # A crashed worker breaks the whole pool, so later charts run in a new one
+            future = _executor(broken=executor).submit(render, spec, data)
+    future.add_done_callback(store)
+    return future
+
+
+def _path(spec, key, version):
+    return os.path.join(CACHE_DIR, version, f"{key}.{spec.get('format', 'png')}")
+
+
+# Cached image bytes, or None
+def _cached(key, path):
+    image = memo.results.get(('chart', key))
+    if image is not None:
+        _stats['memory'] += 1
+        return image
+    try:
+        with open(path, 'rb') as f:
+            image = f.read()
+    except OSError:
+        return None
+    _stats['disk'] += 1
+    return memo.results.put(('chart', key), image)
+
+
+def _store(key, path, image):
+    _stats['rendered'] += 1
+    write_atomic(path, image)
+    memo.results.put(('chart', key), image)
+
+
+# Process pool rasterising charts outside the GIL, started on first use and again after the
+# broken one fails; None when rendering in process
+def _executor(broken=None):
+    global _render_executor
+    if RENDER_WORKERS <= 1:
+        return None
+    with _executor_lock:
+        if _render_executor is not None and _render_executor is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            _render_executor = None
+        if _render_executor is None:
+            # Spawned workers do not inherit the server's threads and locks
+            _render_executor = ProcessPoolExecutor(RENDER_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+        return _render_executor
+
+
+# Write a file atomically, so concurrent sessions never read a partial image
+def write_atomic(path, data):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(partial, 'wb') as f:
+            f.write(data)
+        os.replace(partial, path)
+    except OSError:
+        # A read-only disk only loses the second cache tier
+        pass
+
+
+# Images of replaced data versions can no longer be hit
+@dataset.on_reload
+def _prune(new_dataset):
+    if os.path.isdir(CACHE_DIR):
+        for version in os.listdir(CACHE_DIR):
+            if version != new_dataset.version:
+                shutil.rmtree(os.path.join(CACHE_DIR, version), ignore_errors=True)
+
+
+# Where chart images were served from since startup
+def cache_info():
+    return dict(_stats)
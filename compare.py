@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+# Knockout matchdays of the summary, with their column labels
+KNOCKOUT_COLUMNS = {'Quarter-Finals': 'Quarter Final', 'Semi-Finals': 'Semi Final', 'Final': 'Final'}
+
+
+# Goals per player and value of a column of a goal count table, one row per player (players
+# without goals included) and one column per value
+def pivot(table, players, column):
+    counts = table.groupby(['Player', column], observed=True)['Goals'].sum().unstack(column, fill_value=0)
+    counts.columns = list(counts.columns)
+    return counts.reindex(pd.Index(players, name='Player'), fill_value=0)
+
+
+# Totals per player: goals, home and away goals, teams scored against and knockout goals,
+# counted with bincounts over the category codes of the cells
+def summary(selection):
+    cells = selection.cells
+    players = pd.Index(selection.players, name='Player')
+    codes = cells['Player'].cat.codes.to_numpy()
+    player = np.where(codes >= 0, players.get_indexer(cells['Player'].cat.categories)[codes], -1)
+    rows = player >= 0
+    player, goals = player[rows], cells['Goals'].to_numpy()[rows]
+
+    def per_player(mask=None):
+        if mask is None:
+            return np.bincount(player, weights=goals, minlength=len(players)).astype('int64')
+        mask = mask.to_numpy()[rows]
+        return np.bincount(player[mask], weights=goals[mask], minlength=len(players)).astype('int64')
+
+    # Teams scored against, without the goals of unknown opponents (code -1)
+    opponents = cells['Opponent'].cat
+    opponent = opponents.codes.to_numpy()[rows]
+    pairs = np.unique(player[opponent >= 0] * len(opponents.categories) + opponent[opponent >= 0])
+    return pd.DataFrame({'Goals': per_player(),
+                         'Home': per_player(cells['Venue'] == 'H'), 'Away': per_player(cells['Venue'] == 'A'),
+                         'Opponents': np.bincount(pairs // len(opponents.categories), minlength=len(players)),
+                         **{label: per_player(cells['Matchday'] == matchday)
+                            for matchday, label in KNOCKOUT_COLUMNS.items()}}, index=players)
+
+
+# Top values of the columns per player, most goals first and ties in first-appearance order.
+# One row per player and rank (from 1), players in selection order
+def ranking(table, players, columns, top=None):
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    counts = table.groupby(['Player', *columns], observed=True, dropna=False).agg(
+        Goals=('Goals', 'sum'), First=('First', 'min')).reset_index()
+    position = pd.Index(players).get_indexer(counts['Player'].astype(object))
+    order = np.lexsort((counts['First'].to_numpy(), -counts['Goals'].to_numpy(), position))
+    order = order[position[order] >= 0]
+    counts = counts.take(order)
+    rank = counts.groupby('Player', observed=True).cumcount() + 1
+    if top is not None:
+        counts, rank = counts[rank <= top], rank[rank <= top]
+    counts = counts.drop(columns='First').reset_index(drop=True)
+    counts.insert(1, 'Rank', rank.to_numpy())
+    return counts
+
+
+# Every stat of every player at once: the summary, goals per year, type and position as one
+# wide frame keyed by player, and the top opponents and single matches as ranked rows
+def compare(selection, top=10):
+    wide = pd.concat({'Totals': summary(selection),
+                      'Year': pivot(selection.cells, selection.players, 'Year'),
+                      'Type': pivot(selection.cells, selection.players, 'Type'),
+                      'Position': pivot(selection.cells, selection.players, 'Playing_Position')}, axis=1)
+    return {'players': wide,
+            'opponents': ranking(selection.cells, selection.players, 'Opponent', top),
+            'matches': ranking(selection.matches, selection.players, ['Date', 'Opponent'], top)}
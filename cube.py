@@ -0,0 +1,186 @@
+import numpy as np
+import pandas as pd
+
+import compare
+import preprocessor
+from bitmap import Bitmap, BitmapIndex
+
+# Columns the pages filter on, kept in every aggregate
+FILTER_DIMENSIONS = ['Player', 'Year', 'Competition', 'Matchday', 'Club', 'Opponent', 'Venue']
+
+# Goal count cube: filter columns plus the columns the cards, tables and countplots group on
+DIMENSIONS = FILTER_DIMENSIONS + ['Type', 'Playing_Position']
+
+# Match and minute level aggregates, for the single match tables and the minute histograms
+MATCH_DIMENSIONS = FILTER_DIMENSIONS + ['Date']
+MINUTE_DIMENSIONS = FILTER_DIMENSIONS + ['Minute']
+
+# Aggregate tables of the cube, by their dimensions
+TABLE_DIMENSIONS = [DIMENSIONS, MATCH_DIMENSIONS, MINUTE_DIMENSIONS]
+
+# Filter columns with a bitmap per value. Club and Opponent take a value per team, so their
+# bitmaps would grow with teams x rows; the index matches them on their codes when queried
+INDEXED_DIMENSIONS = ['Year', 'Competition', 'Matchday', 'Venue']
+CODED_DIMENSIONS = ['Club', 'Opponent']
+
+CLASICO_CLUBS = ['Real Madrid', 'FC Barcelona']
+
+
+# Goals per combination of the dimensions, with the row position of the first goal
+# so tables keep the first-appearance order of the raw rows for ties. start is the
+# row position of the first row of df in the dataset. Goals with missing values are
+# kept in groups of their own, so every goal is counted
+def aggregate(df, dimensions, start=0):
+    df = df.assign(First=np.arange(start, start + len(df)))
+    return df.groupby(dimensions, observed=True, dropna=False).agg(
+        Goals=('First', 'size'), First=('First', 'min')).reset_index()
+
+
+# Aggregate of aggregates of the same dimensions, e.g. of consecutive row ranges
+def merge(tables, dimensions):
+    return preprocessor.concat(*tables).groupby(dimensions, observed=True, dropna=False).agg(
+        Goals=('Goals', 'sum'), First=('First', 'min')).reset_index()
+
+
+# Pre-aggregated goal counts of the dataset, built once at load time
+class Cube:
+    def __init__(self, df, players, tables=None):
+        self.players = players
+        tables = tables or [aggregate(df, dimensions) for dimensions in TABLE_DIMENSIONS]
+        self.cells, self.matches, self.minutes = tables
+        self.indexes = [BitmapIndex(table, INDEXED_DIMENSIONS, CODED_DIMENSIONS)
+                        for table in (self.cells, self.matches, self.minutes)]
+
+    # Cube of df given this cube of its first start rows: only the rows after start are
+    # aggregated, then merged into the existing goal counts
+    def append(self, df, start):
+        batch = df.iloc[start:]
+        return Cube(df, self.players, [merge([table, aggregate(batch, dimensions, start)], dimensions) for
+                                       table, dimensions in zip((self.cells, self.matches, self.minutes),
+                                                                TABLE_DIMENSIONS)])
+
+    # Goal counts of a year, optionally only in some competitions / matchdays, El Clásico or at a venue
+    def select(self, year='All Time', competitions=None, matchdays=None, el_clasico=False, venue=None):
+        filters = {'year': year, 'competitions': competitions, 'matchdays': matchdays, 'el_clasico': el_clasico,
+                   'venue': venue}
+        return Selection(self.players, *(filter_table(table, index, **filters) for table, index in
+                                         zip((self.cells, self.matches, self.minutes), self.indexes)), filters=filters)
+
+
+# Rows of an aggregate table matching the filters, intersecting the bitmaps of its index
+def filter_table(table, index, year, competitions, matchdays, el_clasico, venue=None):
+    bitmap = Bitmap.full(len(table))
+    if year != 'All Time':
+        bitmap &= index.equals('Year', year)
+    if competitions is not None:
+        bitmap &= index.isin('Competition', competitions)
+    if matchdays is not None:
+        bitmap &= index.isin('Matchday', matchdays)
+    if el_clasico:
+        bitmap &= index.isin('Club', CLASICO_CLUBS) & index.isin('Opponent', CLASICO_CLUBS)
+    if venue is not None:
+        bitmap &= index.equals('Venue', venue)
+    return table[bitmap.to_mask()]
+
+
+# Filtered goal counts, answering the page queries by lookup
+class Selection:
+    def __init__(self, players, cells, matches, minutes, filters=None):
+        self.players = players
+        self.cells = cells
+        self.matches = matches
+        self.minutes = minutes
+        self.filters = filters or {}
+
+    # Rows of a table for each player, in players order
+    def split(self, table):
+        return tuple(table[table['Player'] == player] for player in self.players)
+
+
+# Ranked table with the index starting at 1, as shown on the pages
+def ranked(table):
+    table.index = np.arange(1, len(table) + 1)
+    return table
+
+
+# Ranked table of each player from the ranking rows of every player, in players order
+def player_tables(selection, rows, names):
+    return tuple(ranked(table.drop(columns=['Player', 'Rank']).rename(columns=names))
+                 for table in selection.split(rows))
+
+
+# Total goals
+def goals(selection):
+    cr_goals, lm_goals = compare.summary(selection)['Goals'].tolist()
+    return cr_goals, lm_goals
+
+
+# Club Goals cards: total, home and away goals and teams scored against
+def club_goal_cards(selection):
+    totals = compare.summary(selection)[['Goals', 'Home', 'Away', 'Opponents']]
+    cr_cards, lm_cards = totals.set_axis(['total', 'home', 'away', 'opponents'], axis=1).to_dict('records')
+    return cr_cards, lm_cards
+
+
+# Opponents Faced
+def opponents_faced(selection):
+    cr_opponent, lm_opponent = compare.summary(selection)['Opponents'].tolist()
+    return cr_opponent, lm_opponent
+
+
+# Quarter, Semi, Final goal
+def quarter_semi_final(selection, matchday):
+    cr_md_goal, lm_md_goal = compare.summary(selection)[compare.KNOCKOUT_COLUMNS[matchday]].tolist()
+    return cr_md_goal, lm_md_goal
+
+
+# Type of goal
+def type_of_goal(selection):
+    cr_goal_type, lm_goal_type = player_tables(
+        selection, compare.ranking(selection.cells, selection.players, 'Type'), {'Type': 'Type of Goal'})
+    return cr_goal_type, lm_goal_type
+
+
+# Goal by Position
+def goal_by_position(selection):
+    cr_goal_pos, lm_goal_pos = player_tables(
+        selection, compare.ranking(selection.cells, selection.players, 'Playing_Position'),
+        {'Playing_Position': 'Position'})
+    return cr_goal_pos, lm_goal_pos
+
+
+# Favourite Opponent
+def favourite_opponent(selection, top=10):
+    cr_fav_opponent, lm_fav_opponent = player_tables(
+        selection, compare.ranking(selection.cells, selection.players, 'Opponent', top), {'Opponent': 'Team'})
+    return cr_fav_opponent, lm_fav_opponent
+
+
+# Goals in a single match
+def goals_in_single_match(selection, top=10):
+    rows = compare.ranking(selection.matches, selection.players, ['Date', 'Opponent'], top).drop(columns='Date')
+    cr_goals_in_single_match, lm_goals_in_single_match = player_tables(selection, rows, {})
+    return cr_goals_in_single_match, lm_goals_in_single_match
+
+
+# Goals per player and value of a column, for the bar charts and minute histograms. Bars and
+# players are in order of first appearance in the selection, as countplot drew the raw rows
+def chart_data(selection, column):
+    table = selection.minutes if column == 'Minute' else selection.cells
+    groups = table.groupby(['Player', column], observed=True, dropna=False)
+    data = groups['Goals'].sum().reset_index()
+    first = groups['First'].min().to_numpy()
+
+    def first_appearance(values):
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            return values
+        values = values.cat.remove_unused_categories()
+        if values.cat.ordered:
+            return values
+        # Earliest first goal per category, categories sorted by it
+        earliest = np.full(len(values.cat.categories), np.iinfo(np.int64).max)
+        codes = values.cat.codes.to_numpy()
+        np.minimum.at(earliest, codes[codes >= 0], first[codes >= 0])
+        return values.cat.reorder_categories(values.cat.categories[np.argsort(earliest, kind='stable')])
+
+    return data.assign(Player=first_appearance(data['Player']), **{column: first_appearance(data[column])})
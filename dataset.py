@@ -0,0 +1,216 @@
+import glob
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+import pyarrow as pa
+
+import cube
+import preprocessor
+import sqlstore
+
+DATA_PATH = './data/data.csv'
+PLAYERS = ['Cristiano Ronaldo', 'Lionel Messi']
+
+# Keep the preprocessed frame in an Arrow IPC file next to the CSV (set to 0 to always parse the CSV)
+BINARY_CACHE = os.environ.get('GOAT_BINARY_CACHE', '1') != '0'
+
+# Backend answering the page selections: 'pandas' (the in-memory cube) or 'sqlite' (indexed
+# queries on a database file next to the CSV)
+BACKENDS = ('pandas', 'sqlite')
+BACKEND = os.environ.get('GOAT_BACKEND', 'pandas')
+if BACKEND not in BACKENDS:
+    raise ValueError(f'unknown GOAT_BACKEND {BACKEND!r}, expected one of {", ".join(BACKENDS)}')
+
+# Preprocessing changes invalidate the binary files as well as CSV changes
+with open(preprocessor.__file__, 'rb') as f:
+    PREPROCESSOR_VERSION = hashlib.sha1(f.read()).hexdigest()[:8]
+
+# Process-wide cache of loaded datasets, shared by every session and rerun
+_cache = {}
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+_reload_hooks = []
+
+
+# Loaded dataset of one version of the CSV file
+class Dataset:
+    def __init__(self, path, key, version, df, memory=None, digest=None, goal_cube=None):
+        self.path = path
+        self.key = key
+        self.version = version
+        self.df = df
+        self.memory = memory
+        self.digest = digest
+        self.years = sorted(int(year) for year in df['Year'].unique())
+        self.cube = goal_cube if goal_cube is not None else build_cube(path, version, df)
+
+
+# Goal cube of the configured backend. When the database file cannot be written (e.g. a
+# read-only data directory), the pages are answered by the in-memory cube instead
+def build_cube(path, version, df):
+    if BACKEND == 'sqlite':
+        try:
+            return sqlstore.SqlCube(path, version, df, PLAYERS)
+        except (OSError, sqlite3.Error):
+            pass
+    return cube.Cube(df, PLAYERS)
+
+
+# Cache key of a file: its absolute path, modification time and size
+def _file_key(path):
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+# Load dataframe and modification, parsing the file once per version
+def load(path=DATA_PATH):
+    key = _file_key(path)
+    with _lock:
+        dataset = _cache.get(key[0])
+        if dataset is not None and dataset.key == key:
+            _stats['hits'] += 1
+            return dataset
+
+        with open(key[0], 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha1(raw)
+        version = digest.hexdigest()[:12]
+
+        # Content is unchanged (e.g. file touched), keep the parsed frame
+        if dataset is not None and dataset.version == version:
+            dataset.key = key
+            _stats['hits'] += 1
+            return dataset
+
+        _stats['misses'] += 1
+        loaded = read_binary(key[0], version) if BINARY_CACHE else None
+        if loaded is None:
+            loaded = parse(raw)
+            if BINARY_CACHE:
+                write_binary(key[0], version, *loaded)
+        dataset = Dataset(key[0], key, version, *loaded, digest=digest)
+        _cache[key[0]] = dataset
+        for hook in _reload_hooks:
+            hook(dataset)
+        return dataset
+
+
+# Append new goal rows (a frame with the columns of the CSV) to the file of a dataset and
+# return the dataset of the new version. Only the new rows are parsed and preprocessed;
+# the frame is extended and their goal counts are merged into the cube
+def append(rows, path=DATA_PATH):
+    columns = pd.read_csv(path, nrows=0).columns
+    text = rows[columns].to_csv(index=False, header=False, lineterminator='\n').encode()
+    # The rows are parsed before the file is touched, so a malformed row raises and leaves the
+    # file as it was. Every column is read as text, as in the full parse
+    raw_df = pd.read_csv(io.BytesIO(text), header=None, names=columns, dtype=str)
+    batch = preprocess(raw_df)
+    while True:
+        current = load(path)
+        with _lock:
+            # Another append or a file change since load: start again from the new version
+            if _cache.get(current.path) is not current or _file_key(current.path) != current.key:
+                continue
+            with open(current.path, 'ab+') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    text = b'\n' + text
+                f.write(text)
+
+            df = preprocessor.concat(current.df, batch)
+            memory = preprocessor.memory_report(raw_df, df)
+            if current.memory is not None:
+                memory['before'] += current.memory['before']
+            digest = current.digest.copy()
+            digest.update(text)
+            version = digest.hexdigest()[:12]
+
+            # The SQLite backend writes the database file of the new version from the frame
+            goal_cube = current.cube.append(df, len(current.df)) if isinstance(current.cube, cube.Cube) else None
+            dataset = Dataset(current.path, _file_key(current.path), version, df, memory, digest=digest,
+                              goal_cube=goal_cube)
+            if BINARY_CACHE:
+                write_binary(current.path, version, df, memory)
+            _cache[current.path] = dataset
+            for hook in _reload_hooks:
+                hook(dataset)
+            return dataset
+
+
+# Preprocessed frame of the CSV bytes and its memory report
+def parse(raw):
+    # Every column is read as text, so a file whose values all look numeric (e.g. no stoppage-time
+    # minute) gets the same columns as appended rows and streamed chunks
+    raw_df = pd.read_csv(io.BytesIO(raw), dtype=str)
+    df = preprocess(raw_df)
+    return df, preprocessor.memory_report(raw_df, df)
+
+
+# Preprocessed frame of raw CSV rows
+def preprocess(raw_df):
+    df = preprocessor.dataframe_modifier(raw_df)
+    df = preprocessor.normalize(df)
+    return preprocessor.compact(df)
+
+
+# Arrow IPC file of a CSV version, e.g. data/data.<version>.<preprocessor>.arrow
+def binary_path(path, version):
+    return f'{os.path.splitext(path)[0]}.{version}.{PREPROCESSOR_VERSION}.arrow'
+
+
+# Frame and memory report from the binary file of a CSV version, or None when it is missing.
+# The file is memory-mapped: its pages are shared by every process reading it
+def read_binary(path, version):
+    try:
+        source = pa.memory_map(binary_path(path, version))
+    except OSError:
+        return None
+    table = pa.ipc.open_file(source).read_all()
+    memory = json.loads(table.schema.metadata[b'memory_report'])
+    memory = pd.DataFrame(memory['data'], index=memory['index'], columns=memory['columns']).astype('Int64')
+    return table.to_pandas(split_blocks=True), memory
+
+
+# Write the binary file of a CSV version atomically and remove those of other versions
+def write_binary(path, version, df, memory):
+    target = binary_path(path, version)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    report = memory.astype(object).where(memory.notna(), None).to_dict('split')
+    table = table.replace_schema_metadata({**table.schema.metadata, b'memory_report': json.dumps(report)})
+    partial = f'{target}.{os.getpid()}.tmp'
+    try:
+        with pa.OSFile(partial, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(partial, target)
+    except OSError:
+        # A read-only data directory only loses the binary cache
+        return
+    for stale in glob.glob(f'{os.path.splitext(path)[0]}.*.arrow'):
+        if stale != target:
+            os.remove(stale)
+
+
+# Register a function called with the new dataset whenever a file version is (re)loaded
+def on_reload(hook):
+    _reload_hooks.append(hook)
+    return hook
+
+
+# Hit/miss counters of the dataset cache
+def cache_info():
+    with _lock:
+        return {'hits': _stats['hits'], 'misses': _stats['misses'], 'entries': len(_cache)}
+
+
+# Drop every cached dataset and reset the counters
+def clear_cache():
+    with _lock:
+        _cache.clear()
+        _stats['hits'] = 0
+        _stats['misses'] = 0
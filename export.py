@@ -0,0 +1,144 @@
+# Static export: every page and year pre-rendered to HTML with its chart images, for serving
+# the comparison from a plain file server or CDN
+# Usage: python export.py [out_dir] [workers]
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import charts
+import dataset
+import helper
+import markup
+import sections
+
+OUT_DIR = './site'
+
+# Layout of the exported pages; the stat boxes keep the app's stylesheet
+LAYOUT = """
+body { font-family: "Source Sans Pro", sans-serif; background: #FFFFFF; color: #31333F; margin: 0; }
+nav { background: #F0F2F6; padding: 1rem 2rem; }
+nav a { margin-right: 1rem; color: #31333F; }
+nav a.selected { font-weight: bold; }
+.block-container { max-width: 1200px; margin: auto; padding-left: 2rem; padding-right: 2rem; }
+.panel { border: 1px solid #E6E6EA; border-radius: 0.5rem; padding: 1rem; margin: 1rem 0; }
+.columns { display: flex; }
+.columns > * { flex: 1; min-width: 0; }
+.panel img { width: 100%; }
+table { border-collapse: collapse; width: 95%; }
+th, td { border-bottom: 1px solid #E6E6EA; padding: 0.25rem 0.5rem; text-align: left; }
+"""
+
+
+# File name part of a page or year
+def slug(value):
+    return re.sub(r'[^a-z0-9]+', '-', str(value).lower()).strip('-')
+
+
+def page_path(page, year):
+    return f'{slug(page)}/{slug(year)}.html'
+
+
+# Links to every page (same year) and every year (same page)
+def navigation(page, year, years):
+    pages = ' '.join(f'<a href="../{page_path(name, year)}"{" class=selected" if name == page else ""}>{name}</a>'
+                     for name in sections.PAGES)
+    year_links = ' '.join(f'<a href="../{page_path(page, value)}"{" class=selected" if value == year else ""}>{value}</a>'
+                          for value in years)
+    return f'<nav><div>{pages}</div><div>{year_links}</div></nav>'
+
+
+def columns(*cells):
+    return '<div class="columns">' + ''.join(f'<div>{cell}</div>' for cell in cells) + '</div>'
+
+
+# HTML of a panel with every control at its default, writing its chart image once
+def panel_html(panel, data, year, out_dir):
+    values = sections.compute(panel, data, year)
+    parts = [markup.heading(panel['title'])]
+    if 'cards' in values:
+        for index, (player, name) in enumerate(markup.PLAYER_ROWS):
+            parts.append(columns(markup.stat_box(player, name, 'Stats'),
+                                 *(markup.stat_box(player, card[index + 1], card[0]) for card in values['cards'])))
+    if 'goals' in values:
+        parts.append(columns(markup.stat_box('ronaldo', values['goals'][0], 'Ronaldo'),
+                             markup.stat_box('messi', values['goals'][1], 'Messi')))
+    if 'tables' in values:
+        parts.append(columns(*(f'<h3>{name}\'s Stats:</h3>{table.to_html(border=0)}'
+                               for name, table in zip(['Ronaldo', 'Messi'], values['tables']))))
+    if 'chart' in panel:
+        spec, selection = panel['chart'], values['selection']
+        name = f"{charts.cache_key(spec, selection, data.version)}.{spec.get('format', 'png')}"
+        path = os.path.join(out_dir, 'charts', name)
+        if not os.path.exists(path):
+            charts.write_atomic(path, charts.cached_render(spec, selection, data.version))
+        parts.append(f'<img src="../charts/{name}" alt="{spec.get("title", panel["title"])}">')
+    return f'<section class="panel">{"".join(parts)}</section>'
+
+
+# Write the HTML file of a page and year; returns its path
+def export_page(page, year, out_dir=OUT_DIR):
+    data = dataset.load()
+    years = helper.filter_year(data.df)
+    body = ''.join(panel_html(panel, data, year, out_dir) for panel in sections.PAGES[page])
+    html = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>GOAT-Debate | {page} | {year}</title>
+<link rel="icon" href="../favicon.png">
+<link rel="stylesheet" href="../style.css">
+</head>
+<body>
+{navigation(page, year, years)}
+<div class="block-container">
+<h1 style="text-align: center;">Cristiano Ronaldo vs Lionel Messi</h1>
+<h2 style="text-align: center;">{page} | {year}</h2>
+{body}
+</div>
+</body>
+</html>
+"""
+    path = os.path.join(out_dir, page_path(page, year))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    return path
+
+
+# Chart rendering stays in each export worker, which already has a core of its own
+def _init_worker():
+    charts.RENDER_WORKERS = 1
+
+
+# Export every page and year, spread over worker processes
+def export(out_dir=OUT_DIR, workers=None):
+    start = time.perf_counter()
+    data = dataset.load()
+    jobs = [(page, year, out_dir) for page in sections.PAGES for year in helper.filter_year(data.df)]
+    os.makedirs(os.path.join(out_dir, 'charts'), exist_ok=True)
+    with open(os.path.join(out_dir, 'style.css'), 'w') as f:
+        f.write(markup.STYLE + LAYOUT)
+    shutil.copy('./img/favicon.png', os.path.join(out_dir, 'favicon.png'))
+    with open(os.path.join(out_dir, 'index.html'), 'w') as f:
+        f.write(f'<!DOCTYPE html><meta http-equiv="refresh" content="0; url={page_path("Overall", "All Time")}">')
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        paths = [export_page(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker) as executor:
+            paths = list(executor.map(export_page, *zip(*jobs)))
+
+    size = sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(out_dir) for name in names)
+    print(f'exported {len(paths)} pages and {len(os.listdir(os.path.join(out_dir, "charts")))} charts '
+          f'to {out_dir} ({size / 2 ** 20:.1f} MB) with {workers} workers in {time.perf_counter() - start:.1f} s')
+    return paths
+
+
+if __name__ == '__main__':
+    export(sys.argv[1] if len(sys.argv) > 1 else OUT_DIR, int(sys.argv[2]) if len(sys.argv) > 2 else None)
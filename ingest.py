@@ -0,0 +1,77 @@
+# Streaming ingestion of goal logs too large to load at once: the CSV is read in chunks, each
+# chunk is preprocessed and folded into the goal count cube, and only the cube is kept. The
+# cube keeps about a row per goal (goals rarely share a player, match and minute), so memory
+# still grows with the log: streaming saves the raw and preprocessed frames, not the cube
+# Usage: python ingest.py path [chunk_rows]
+import os
+import resource
+import sys
+import time
+
+import pandas as pd
+
+import cube
+import dataset
+
+# Rows read and preprocessed at a time
+CHUNK_ROWS = int(os.environ.get('GOAT_CHUNK_ROWS', 100_000))
+
+
+# Running aggregate of one cube table. Chunk aggregates wait aside and are merged into the
+# table once they hold as many rows as it does, so each row is merged O(log n) times
+class Fold:
+    def __init__(self, dimensions):
+        self.dimensions = dimensions
+        self.table = None
+        self.pending = []
+
+    def add(self, table):
+        self.pending.append(table)
+        if self.table is None or sum(len(pending) for pending in self.pending) >= len(self.table):
+            self.result()
+
+    def result(self):
+        if self.pending:
+            tables = self.pending if self.table is None else [self.table, *self.pending]
+            self.table = cube.merge(tables, self.dimensions)
+            self.pending = []
+        return self.table
+
+
+# Peak resident memory of this process, in MB
+def peak_memory():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# Goal count cube of a CSV file read chunk by chunk, for the players (every player of the
+# file by default), and the ingestion report
+def stream(path, players=None, chunk_rows=CHUNK_ROWS):
+    start = time.perf_counter()
+    folds = [Fold(dimensions) for dimensions in cube.TABLE_DIMENSIONS]
+    rows = chunks = 0
+    # Every column of the file is read as text, as in the full parse of the whole file
+    for raw_df in pd.read_csv(path, chunksize=chunk_rows, dtype=str):
+        df = dataset.preprocess(raw_df.reset_index(drop=True))
+        for fold in folds:
+            fold.add(cube.aggregate(df, fold.dimensions, rows))
+        rows += len(df)
+        chunks += 1
+    if not rows:
+        raise ValueError(f'no goal rows in {path}')
+
+    tables = [fold.result() for fold in folds]
+    goal_cube = cube.Cube(None, players or list(tables[0]['Player'].cat.categories), tables)
+    seconds = time.perf_counter() - start
+    return goal_cube, {'rows': rows, 'chunks': chunks, 'seconds': seconds, 'rows_per_second': rows / seconds,
+                       'cells': [len(table) for table in tables], 'peak_mb': peak_memory()}
+
+
+def report(result):
+    return (f"ingested {result['rows']} rows in {result['chunks']} chunks in {result['seconds']:.1f} s "
+            f"({result['rows_per_second']:,.0f} rows/s)\n"
+            f"cube: {result['cells'][0]} cells, {result['cells'][1]} match rows, {result['cells'][2]} minute rows, "
+            f"peak memory {result['peak_mb']:.0f} MB")
+
+
+if __name__ == '__main__':
+    print(report(stream(sys.argv[1], chunk_rows=int(sys.argv[2]) if len(sys.argv) > 2 else CHUNK_ROWS)[1]))
@@ -0,0 +1,25 @@
+import os
+
+# Stylesheet of the stat boxes, shared by the app and the static export
+STYLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'style.css')
+
+with open(STYLE_PATH) as f:
+    STYLE = f.read()
+
+# Stat box rows of the two players: theme, header box label
+PLAYER_ROWS = [('ronaldo', 'CR7'), ('messi', 'LM10')]
+
+
+# Stat box of a player theme (ronaldo / messi)
+def stat_box(player, value, label):
+    return f"""
+        <div class="stat-box stat-box-{player}">
+            <h1>{value}</h1>
+            <p>{label}</p>
+        </div>
+    """
+
+
+# Centered panel heading
+def heading(title):
+    return f"<h2 style='text-align: center; margin:1rem;'>{title}</h2>"
@@ -0,0 +1,94 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+import dataset
+
+# Size limits of the shared render cache, configurable through the environment
+MAX_ENTRIES = int(os.environ.get('GOAT_MEMO_MAX_ENTRIES', 2048))
+MAX_BYTES = int(os.environ.get('GOAT_MEMO_MAX_BYTES', 256 * 1024 * 1024))
+
+
+# Approximate memory footprint of a cached value, in bytes
+def size_of(value):
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(size_of(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(size_of(item) for item in value.values())
+    if hasattr(value, '__dict__'):
+        return sys.getsizeof(value) + size_of(vars(value))
+    return sys.getsizeof(value)
+
+
+# Thread-safe least-recently-used cache bounded by entry count and total size
+class LRUCache:
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                self._stats['misses'] += 1
+                return default
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return self._entries[key][0]
+
+    def put(self, key, value):
+        size = size_of(value)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            # Values larger than the whole cache are not kept
+            if size > self.max_bytes:
+                return value
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._bytes -= self._entries.popitem(last=False)[1][1]
+                self._stats['evictions'] += 1
+        return value
+
+    def get_or_compute(self, key, compute):
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = self.put(key, compute())
+        return value
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries), bytes=self._bytes,
+                        max_entries=self.max_entries, max_bytes=self.max_bytes)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+# Computed tables and figure images per (page, year, data version), shared by every session
+results = LRUCache()
+
+# Entries of a replaced file version can no longer be hit
+dataset.on_reload(lambda new_dataset: results.clear())
+
+
+# Cached result of a page computation
+def cached(page_key, name, compute):
+    return results.get_or_compute(page_key + (name,), compute)
+
@@ -1,24 +1,125 @@
+import numpy as np
 import pandas as pd
 
+# Name fixes of the dataset: mojibake and aliases mapped to the display name
+NAME_FIXES = {
+    'Competition': {
+        'Supercopa': 'Supercopa de España',
+        'Italy Cup': 'Coppa Italia',
+        'Troph�e des Champions': 'Trophée des Champions',
+        'Champions League': 'UEFA Champions League',
+    },
+    'Matchday': {
+        'final': 'Final',
+        'last 16': 'Round of 16',
+    },
+    'Opponent': {
+        'CÃ³rdoba CF': 'Córdoba CF',
+        'Sporting GijÃ³n': 'Sporting de Gijón',
+        'FC ZÃ¼rich': 'FC Zürich',
+        'MalmÃ¶ FF': 'Malmö FF',
+        'Borussia MÃ¶nchengladbach': 'Borussia Mönchengladbach',
+        'GrÃªmio Foot-Ball Porto Alegrense': 'Grêmio Foot-Ball Porto Alegrense',
+        'Deportivo de La CoruÃ±a': 'Deportivo de La Coruña',
+        'Deportivo de La Coruaa': 'Deportivo de La Coruña',
+    },
+}
+
+# Fill values of columns with missing data
+MISSING_VALUES = {
+    'Type': 'Not Reported in Data',
+    'Playing_Position': 'Not Reported in Data',
+}
+
+# Remaining string columns with few distinct values, stored as categoricals
+CATEGORICAL_COLUMNS = ['Player', 'Season', 'Venue', 'Club', 'Result', 'At_score', 'Goal_assist']
+
 # Modification function of dataframe
 def dataframe_modifier(df):
-    years = []
-    for i in df['Date'].str.split('/'):
-        years.append(i[2])
-    years = pd.DataFrame(years)
-    years = years.rename(columns={0: 'Year'})
-    df = df.join(years, how='outer')
-    return df
-
-# Preprocessing function of dataframe
-def preprocess(df, year):
-    df['Competition'] = df['Competition'].replace(['Supercopa', 'Italy Cup', 'Troph�e des Champions', 'Champions League'], ['Supercopa de España', 'Coppa Italia', 'Trophée des Champions', 'UEFA Champions League'])
-    df['Matchday'] = df['Matchday'].replace(['final', 'last 16'],['Final', 'Round of 16'])
-    df['Opponent'] = df['Opponent'].replace(['CÃ³rdoba CF', 'Sporting GijÃ³n', 'FC ZÃ¼rich', 'MalmÃ¶ FF', 'Borussia MÃ¶nchengladbach', 'GrÃªmio Foot-Ball Porto Alegrense', 'Deportivo de La CoruÃ±a', 'Deportivo de La Coruaa'],['Córdoba CF', 'Sporting de Gijón', 'FC Zürich', 'Malmö FF', 'Borussia Mönchengladbach','Grêmio Foot-Ball Porto Alegrense', 'Deportivo de La Coruña', 'Deportivo de La Coruña'])
-    df['Type'].fillna('Not Reported in Data', inplace=True)
-    df['Playing_Position'].fillna('Not Reported in Data', inplace=True)
-    if year == 'All Time':
-        new_df = df
-    if year != 'All Time':
-        new_df = df[df['Year'] == year]
-    return new_df
\ No newline at end of file
+    # Parse each distinct date once with a fixed format, then broadcast back to the rows
+    codes, uniques = pd.factorize(df['Date'])
+    # Code -1 is a missing date, which take would read as the last date
+    if (codes < 0).any():
+        raise ValueError(f"missing Date in rows {df.index[codes < 0].tolist()[:10]}")
+    dates = pd.DatetimeIndex(pd.to_datetime(uniques, format='%m/%d/%Y'))
+    return df.assign(Date=dates.take(codes),
+                     Year=dates.year.astype('int16').take(codes),
+                     Month=dates.month.astype('int8').take(codes),
+                     Weekday=dates.weekday.astype('int8').take(codes))
+
+# Categorical column with the fixes applied to its distinct values only. Categories keep the
+# order of first appearance, the order the charts drew raw string columns in
+def categorical(values, fixes=None, fill=None):
+    if fill is not None:
+        values = values.fillna(fill)
+    codes, uniques = pd.factorize(values)
+    if fixes:
+        uniques = uniques.map(lambda value: fixes.get(value, value))
+    categories = uniques.unique()
+    # Missing values (code -1) stay missing, also when every value is missing
+    codes = take_missing(categories.get_indexer(uniques), codes, -1)
+    return pd.Series(pd.Categorical.from_codes(codes, categories), index=values.index, name=values.name)
+
+# Normalization function of dataframe, run once at load time
+def normalize(df):
+    columns = {column: categorical(df[column], fixes=fixes) for column, fixes in NAME_FIXES.items()}
+    columns.update({column: categorical(df[column], fill=fill) for column, fill in MISSING_VALUES.items()})
+    return df.assign(**columns)
+
+# Compact columnar representation: categoricals and integer minutes
+def compact(df):
+    columns = {column: categorical(df[column]) for column in CATEGORICAL_COLUMNS}
+
+    # '90+5' is split into base minute 90 and stoppage time 5, once per distinct value
+    codes, uniques = pd.factorize(df['Minute'])
+    base, stoppage = minute_parts(uniques)
+    order = np.lexsort((stoppage, base))
+    # Missing minutes (code -1) stay missing, in nullable integer columns
+    missing = codes < 0
+    minute = pd.Categorical.from_codes(take_missing(np.argsort(order), codes, -1),
+                                       categories=uniques.take(order), ordered=True)
+    columns['Minute'] = pd.Series(minute, index=df.index)
+    columns['Minute_Base'] = pd.Series(pd.arrays.IntegerArray(take_missing(base, codes, 0), missing),
+                                       index=df.index)
+    columns['Minute_Stoppage'] = pd.Series(pd.arrays.IntegerArray(take_missing(stoppage, codes, 0), missing),
+                                           index=df.index)
+    return df.assign(**columns)
+
+# Values at factorize codes, with fill at code -1 (a missing value) instead of the last value
+def take_missing(values, codes, fill):
+    return np.append(values, np.array(fill, dtype=values.dtype))[codes]
+
+# Base minute and stoppage time of minute values: '90+5' is 90 and 5
+def minute_parts(values):
+    parts = pd.Series(values).str.extract(r'^(\d+)(?:\+(\d+))?$').astype('float')
+    return parts[0].astype('int16').to_numpy(), parts[1].fillna(0).astype('int8').to_numpy()
+
+# Rows of preprocessed frames (or aggregates of them) as one frame, with the categories of
+# each column merged and ordered as if every row had been preprocessed together; frames are
+# given in row order, so new categories follow those of earlier rows
+def concat(*frames):
+    dtypes = {}
+    for column, values in frames[0].items():
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            continue
+        categories = values.cat.categories.append([frame[column].cat.categories for frame in frames[1:]]).unique()
+        if column == 'Minute':
+            base, stoppage = minute_parts(categories)
+            dtypes[column] = pd.CategoricalDtype(categories.take(np.lexsort((stoppage, base))), ordered=True)
+        else:
+            dtypes[column] = pd.CategoricalDtype(categories)
+    return pd.concat([frame.astype(dtypes) for frame in frames], ignore_index=True)
+
+# Memory footprint per column, in bytes, before and after compaction
+def memory_report(raw_df, df):
+    report = pd.DataFrame({'before': raw_df.memory_usage(deep=True, index=False),
+                           'after': {column: nbytes(values) for column, values in df.items()}}).reindex(df.columns)
+    report.loc['Total'] = report.sum()
+    return report.astype('Int64')
+
+# Bytes of a column; categoricals count their codes and categories, without the lookup table
+# pandas caches on categories once they are searched
+def nbytes(values):
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.nbytes + pd.Index(values.cat.categories.array).memory_usage(deep=True)
+    return values.memory_usage(deep=True, index=False)
@@ -0,0 +1,197 @@
+import cube
+import charts
+import memo
+
+# Competitions of each competition group shown on the pages
+COMPETITION_GROUPS = {
+    'League': ['Liga Portugal', 'Premier League', 'LaLiga', 'Serie A', 'Ligue 1', 'Saudi Pro League'],
+    "Europe's Top 5": ['Premier League', 'LaLiga', 'Serie A', 'Ligue 1'],
+    'LaLiga': ['LaLiga'],
+    'UEFA Champions League': ['UEFA Champions League'],
+    'Domestic Cup': ['Copa del Rey', 'Coppa Italia', 'FA Cup', 'EFL Cup'],
+    'Copa del Rey': ['Copa del Rey'],
+    'Domestic Super Cup': ['Supercopa de España', 'Supercoppa Italiana', 'Trophée des Champions'],
+    'Supercopa de España': ['Supercopa de España'],
+    'Other Cups': ['UEFA Champions League Qualifying', 'FIFA Club World Cup', 'UEFA Super Cup', 'Europa League'],
+}
+
+KNOCKOUT_MATCHDAYS = ['Quarter-Finals', 'Semi-Finals', 'Final']
+
+# Options of the venue control, with the Venue value they filter on
+VENUES = {'All': None, 'Home': 'H', 'Away': 'A'}
+
+# Ranked tables of the table panels
+TABLES = {
+    'favourite_opponent': cube.favourite_opponent,
+    'goals_in_single_match': cube.goals_in_single_match,
+    'type_of_goal': cube.type_of_goal,
+    'goal_by_position': cube.goal_by_position,
+}
+
+
+# Filters of a competition group (None for every competition), as passed to Cube.select
+def filters(group=None, matchdays=None, el_clasico=False, venue=None):
+    return {'competitions': COMPETITION_GROUPS[group] if group else None,
+            'matchdays': matchdays, 'el_clasico': el_clasico, 'venue': venue}
+
+
+# Total, home and away goals and teams scored against, with a chart
+def club_goals(title, group, chart, expanded=True):
+    return {'kind': 'club_goals', 'title': title, 'filters': filters(group), 'chart': chart, 'expanded': expanded}
+
+
+# Quarter-final, semi-final and final goals and knockout teams scored against, with a chart
+def knockout_goals(title, chart, expanded=True):
+    return {'kind': 'knockout_goals', 'title': title, 'filters': filters(),
+            'knockout_filters': filters(matchdays=KNOCKOUT_MATCHDAYS), 'chart': chart, 'expanded': expanded}
+
+
+# El Clásico goals of a competition group, with a chart
+def el_clasico(title, group, chart, expanded=True):
+    return {'kind': 'el_clasico', 'title': title, 'filters': filters(group, el_clasico=True), 'chart': chart,
+            'expanded': expanded}
+
+
+# Ranked table per player, computed once opened; 'top' controls apply to the
+# favourite opponent and single match tables
+def table(title, name, group=None, expanded=False):
+    controls = ('venue', 'top') if name in ('favourite_opponent', 'goals_in_single_match') else ('venue',)
+    return {'kind': 'table', 'title': title, 'table': name, 'filters': filters(group), 'expanded': expanded,
+            'controls': controls}
+
+
+# Goals per minute histogram, computed and drawn once opened
+def minute_goals(title, group=None, expanded=False):
+    return {'kind': 'minute_goals', 'title': title, 'filters': filters(group), 'chart': charts.minute_histogram(),
+            'expanded': expanded, 'controls': ('venue',)}
+
+
+# Tables and minute histogram closing every competition page
+def ranking_tables(name, group):
+    return [
+        table(f'Favourite {name} Opponents', 'favourite_opponent', group),
+        table(f'Most Goals in a Single {name} Match', 'goals_in_single_match', group),
+        table(f'Types of {name} Goals', 'type_of_goal', group),
+        table(f'Position-wise {name} Goals', 'goal_by_position', group),
+        minute_goals(f'Goals per Minute in {group}', group),
+    ]
+
+
+# Panels of every page, in display order
+PAGES = {
+    'Overall': [
+        club_goals('Club Goals', None, charts.bar_chart('Competition', 'Goals per Competition', (6, 5))),
+        knockout_goals('Final, Quarter Final and Semi Final Performance',
+                       charts.bar_chart('Competition', 'Goals per Competition', (7, 4))),
+        el_clasico('El Clásico Goals', None,
+                   charts.bar_chart('Venue', 'El Clásico Goals per Competition', (8, 2), xticks=(0, 20, 5))),
+        table('Favourite Opponents', 'favourite_opponent'),
+        table('Most Goals in a Single Match', 'goals_in_single_match'),
+        table('Types of Goals', 'type_of_goal'),
+        table('Position-wise Goals', 'goal_by_position'),
+        minute_goals('Goals per Minute'),
+    ],
+    'League': [
+        club_goals('League Goals', 'League',
+                   charts.bar_chart('Competition', 'League Goals per Competition', (7, 4))),
+        club_goals("Europe's Top 5 League Goals", "Europe's Top 5",
+                   charts.bar_chart('Competition', "Europe's Top 5 League Goals per Competition", (7, 4))),
+        club_goals('LaLiga Goals', 'LaLiga',
+                   charts.bar_chart('Matchday', 'LaLiga Goals per Matchday', (8, 8), numeric=True)),
+        el_clasico('LaLiga: El Clásico Goals', 'LaLiga',
+                   charts.bar_chart('Venue', 'El Clásico League Goals per Venue', (8, 2))),
+        *ranking_tables('League', 'League'),
+    ],
+    'UEFA Champions League': [
+        club_goals('UEFA Champions League Goals', 'UEFA Champions League',
+                   charts.bar_chart('Matchday', 'UEFA Champions League Goals per Matchday', (7, 4))),
+        el_clasico('UEFA Champions League: El Clásico  Goals', 'UEFA Champions League',
+                   charts.bar_chart('Venue', 'UEFA Champions League El Clásico Goals per Venue', (12, 1),
+                                    xticks=(1, 3, 1))),
+        *ranking_tables('UEFA Champions League', 'UEFA Champions League'),
+    ],
+    'Domestic Cup': [
+        club_goals('Domestic Cup Goals', 'Domestic Cup',
+                   charts.bar_chart('Competition', 'Domestic Cup Goals per Competition', (10, 5))),
+        club_goals('Copa Del Ray Goals', 'Copa del Rey',
+                   charts.bar_chart('Matchday', 'Copa del Rey Goals per Matchday', (10, 5))),
+        el_clasico('Copa del Rey: El Clásico Goals', 'Copa del Rey',
+                   charts.bar_chart('Venue', 'Copa del Rey El Clásico Goals per Venue', (8, 2), xticks=(1, 5, 1))),
+        *ranking_tables('Domestic Cup', 'Domestic Cup'),
+    ],
+    'Domestic Super Cup': [
+        club_goals('Domestic Super Cup Goals', 'Domestic Super Cup',
+                   charts.bar_chart('Competition', 'Domestic Super Cup Goals per Competition', (10, 5))),
+        club_goals('Supercopa de España Goals', 'Supercopa de España',
+                   charts.bar_chart('Matchday', 'Supercopa de España Goals per Matchday', (10, 4))),
+        el_clasico('Supercopa de España: El Clásico Goals', 'Supercopa de España',
+                   charts.bar_chart('Venue', 'Supercopa de España El Clásico Goals per Venue', (8, 2))),
+        *ranking_tables('Domestic Super Cup', 'Domestic Super Cup'),
+    ],
+    'Other Cups': [
+        club_goals("Other Cups' Goals", 'Other Cups',
+                   charts.bar_chart('Competition', "Other Cups' Goals per Competition", (8, 5))),
+        *ranking_tables("Other Cups'", 'Other Cups'),
+    ],
+}
+
+# Unique key of every panel, for its expander state and timing
+for page, panels in PAGES.items():
+    for panel in panels:
+        panel['key'] = f"{page}/{panel['title']}"
+
+# Last measured compute and render time of every panel, in seconds
+_timings = {}
+
+
+# Hashable form of panel filters, for cache keys
+def frozen(panel_filters):
+    return tuple((name, tuple(value) if isinstance(value, list) else value)
+                 for name, value in sorted(panel_filters.items()))
+
+
+# Goal counts of a year and filters, shared by every panel and page using them
+def selection(data, year, panel_filters):
+    return memo.cached((data.version, year), ('selection', frozen(panel_filters)),
+                       lambda: data.cube.select(year, **panel_filters))
+
+
+# Values a panel shows: per player stat cards or tables, and the selection its chart is drawn from.
+# venue and top are the panel's own controls, applied on top of its filters
+def compute(panel, data, year, venue=None, top=None):
+    panel_filters = dict(panel['filters'], venue=venue) if venue else panel['filters']
+    sel = selection(data, year, panel_filters)
+    key = (panel['kind'], panel.get('table'), frozen(panel_filters), top)
+    return memo.cached((data.version, year), key, lambda: _compute(panel, data, year, sel, top))
+
+
+# Record how long a panel took to compute and render
+def record(panel, seconds):
+    _timings[panel['key']] = seconds
+
+
+# Last measured time of a panel, None if it was never opened
+def timing(panel):
+    return _timings.get(panel['key'])
+
+
+def _compute(panel, data, year, sel, top=None):
+    kind = panel['kind']
+    if kind == 'club_goals':
+        cr_cards, lm_cards = cube.club_goal_cards(sel)
+        return {'cards': [(label, cr_cards[name], lm_cards[name]) for name, label in
+                          [('total', 'Total Goals'), ('home', 'Home Goals'), ('away', 'Away Goals'),
+                           ('opponents', 'Scored Against')]],
+                'selection': sel}
+    if kind == 'knockout_goals':
+        knockout = selection(data, year, panel['knockout_filters'])
+        cards = [(label, *cube.quarter_semi_final(sel, matchday)) for matchday, label in
+                 zip(KNOCKOUT_MATCHDAYS, ['Quarter Final', 'Semi Final', 'Final'])]
+        cards.append(('Scored Against', *cube.opponents_faced(knockout)))
+        return {'cards': cards, 'selection': knockout}
+    if kind == 'el_clasico':
+        return {'goals': cube.goals(sel), 'selection': sel}
+    if kind == 'table':
+        tables = TABLES[panel['table']]
+        return {'tables': tables(sel, top=top) if top else tables(sel)}
+    return {'selection': sel}
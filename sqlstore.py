@@ -0,0 +1,110 @@
+# SQLite backend of the page selections: the goals table in a database file next to the CSV,
+# indexed on the filter columns, with the goal counts of a selection aggregated by SQL
+import glob
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+import cube
+
+# Columns stored per goal; Row is the position of the goal in the dataset
+COLUMNS = list(dict.fromkeys(cube.DIMENSIONS + cube.MATCH_DIMENSIONS + cube.MINUTE_DIMENSIONS))
+
+# Indexes of the page filters: year and competition group (and knockout matchdays),
+# competition group alone, El Clásico clubs and the rows of a player
+INDEXES = {
+    'goals_year': ['Year', 'Competition', 'Matchday'],
+    'goals_competition': ['Competition', 'Matchday'],
+    'goals_opponent': ['Opponent', 'Club'],
+    'goals_player': ['Player', 'Year'],
+}
+
+
+# Database file of a CSV version, e.g. data/data.<version>.sqlite
+def database_path(path, version):
+    return f'{os.path.splitext(path)[0]}.{version}.sqlite'
+
+
+# Write the goals of the frame and the indexes to a database file atomically, and remove
+# those of other versions
+def build(target, df):
+    partial = f'{target}.{os.getpid()}.tmp'
+    if os.path.exists(partial):
+        os.remove(partial)
+    goals = df[COLUMNS].astype({'Date': 'str'}).astype({column: object for column in COLUMNS if column != 'Year'})
+    try:
+        with sqlite3.connect(partial) as connection:
+            goals.rename_axis('Row').to_sql('goals', connection, index=True, chunksize=100_000)
+            for name, columns in INDEXES.items():
+                connection.execute(f'CREATE INDEX {name} ON goals ({", ".join(columns)})')
+        connection.close()
+        os.replace(partial, target)
+    except (OSError, sqlite3.Error):
+        # e.g. a full disk: no partial file is left behind
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    stem = target.rsplit('.', 2)[0]
+    for stale in glob.glob(f'{stem}.*.sqlite'):
+        if stale != target:
+            os.remove(stale)
+
+
+# WHERE clause and parameters of the filters of Cube.select
+def where(year, competitions, matchdays, el_clasico, venue):
+    clauses, params = [], []
+
+    def isin(column, values):
+        clauses.append(f'{column} IN ({", ".join("?" * len(values))})')
+        params.extend(values)
+
+    if year != 'All Time':
+        clauses.append('Year = ?')
+        params.append(int(year))
+    if competitions is not None:
+        isin('Competition', competitions)
+    if matchdays is not None:
+        isin('Matchday', matchdays)
+    if el_clasico:
+        isin('Club', cube.CLASICO_CLUBS)
+        isin('Opponent', cube.CLASICO_CLUBS)
+    if venue is not None:
+        clauses.append('Venue = ?')
+        params.append(venue)
+    return ' AND '.join(clauses) or '1', params
+
+
+# Goal counts of the dataset in a SQLite file, answering Cube.select with one indexed
+# GROUP BY query per aggregate table
+class SqlCube:
+    def __init__(self, path, version, df, players):
+        self.players = players
+        self.database = database_path(path, version)
+        if not os.path.exists(self.database):
+            build(self.database, df)
+        # Result columns get the dtypes of the frame, so selections match those of the pandas cube
+        self.dtypes = {column: df[column].dtype for column in COLUMNS}
+        self._local = threading.local()
+
+    # Read-only connection of the calling thread
+    def connection(self):
+        if not hasattr(self._local, 'connection'):
+            self._local.connection = sqlite3.connect(f'file:{self.database}?mode=ro', uri=True)
+        return self._local.connection
+
+    def aggregate(self, dimensions, clause, params):
+        columns = ', '.join(dimensions)
+        table = pd.read_sql_query(f'SELECT {columns}, COUNT(*) AS Goals, MIN(Row) AS First FROM goals '
+                                  f'WHERE {clause} GROUP BY {columns}', self.connection(), params=params)
+        dtypes = {column: self.dtypes[column] for column in dimensions}
+        return table.astype({**dtypes, 'Goals': 'int64', 'First': 'int64'})
+
+    # Goal counts of a year, optionally only in some competitions / matchdays, El Clásico or at a venue
+    def select(self, year='All Time', competitions=None, matchdays=None, el_clasico=False, venue=None):
+        filters = {'year': year, 'competitions': competitions, 'matchdays': matchdays, 'el_clasico': el_clasico,
+                   'venue': venue}
+        clause, params = where(**filters)
+        return cube.Selection(self.players, *(self.aggregate(dimensions, clause, params)
+                                              for dimensions in cube.TABLE_DIMENSIONS), filters=filters)
@@ -0,0 +1,73 @@
+# Warm-up of the data, result and chart caches over every page and year, so the first
+# visitors after a deploy get cached pages
+# Usage: python warmup.py
+import os
+import threading
+import time
+
+import charts
+import dataset
+import helper
+import memo
+import sections
+
+# Warm the caches in a background thread when the app starts (set to 0 to disable)
+WARM_ON_START = os.environ.get('GOAT_WARMUP', '1') != '0'
+
+_started = False
+_lock = threading.Lock()
+
+
+# Compute every panel and render every chart of the pages for the years, with default controls
+def warm(path=dataset.DATA_PATH, pages=None, years=None):
+    start = time.perf_counter()
+    data = dataset.load(path)
+    pages = pages or list(sections.PAGES)
+    years = years or helper.filter_year(data.df)
+    rendered = charts.cache_info()['rendered']
+
+    panels, futures = 0, []
+    for page in pages:
+        for year in years:
+            for panel in sections.PAGES[page]:
+                values = sections.compute(panel, data, year)
+                panels += 1
+                if 'chart' in panel:
+                    futures.append(charts.render_async(panel['chart'], values['selection'], data.version))
+    for future in futures:
+        future.result()
+
+    return {'pages': len(pages), 'years': len(years), 'panels': panels, 'charts': len(futures),
+            'rendered': charts.cache_info()['rendered'] - rendered, 'seconds': time.perf_counter() - start,
+            'memory': memo.results.stats(), 'disk_bytes': disk_usage(data.version)}
+
+
+# Bytes of chart images on disk for a data version
+def disk_usage(version):
+    directory = os.path.join(charts.CACHE_DIR, version)
+    if not os.path.isdir(directory):
+        return 0
+    return sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+
+def report(result):
+    memory = result['memory']
+    return (f"warmed {result['pages']} pages x {result['years']} years: {result['panels']} panels, "
+            f"{result['charts']} charts ({result['rendered']} rendered) in {result['seconds']:.1f} s\n"
+            f"memory cache: {memory['entries']} entries, {memory['bytes'] / 2 ** 20:.1f} MB "
+            f"({memory['evictions']} evictions), disk cache: {result['disk_bytes'] / 2 ** 20:.1f} MB")
+
+
+# Warm the caches once per process in a daemon thread, printing the report when done
+def start_in_background(path=dataset.DATA_PATH):
+    global _started
+    with _lock:
+        if _started or not WARM_ON_START:
+            return False
+        _started = True
+    threading.Thread(target=lambda: print(report(warm(path)), flush=True), name='warmup', daemon=True).start()
+    return True
+
+
+if __name__ == '__main__':
+    print(report(warm()))